@@ -0,0 +1,191 @@
+"""Audio capture and voice activity detection helpers shared by the CLI and daemon."""
+
+import functools
+import platform
+import subprocess
+
+import numpy as np
+
+
+def _load_whisper():
+    """Import faster-whisper.
+    
+    Importing it loads CTranslate2, so callers defer this until a model is
+    loaded; --help and argument errors never pay for it. cuDNN must already
+    be set up. Returns WhisperModel and BatchedInferencePipeline, which is
+    None before faster-whisper 1.1.
+    """
+    from faster_whisper import WhisperModel
+    
+    # Batched decoding of one long recording needs faster-whisper >= 1.1
+    try:
+        from faster_whisper import BatchedInferencePipeline
+    except ImportError:
+        BatchedInferencePipeline = None
+        
+    return WhisperModel, BatchedInferencePipeline
+
+
+# WebRTC's VAD is optional; when installed it confirms that VAD frames above
+# the silence threshold actually contain speech rather than steady noise
+try:
+    import webrtcvad
+except ImportError:
+    webrtcvad = None
+
+# 0 (least) to 3 (most) aggressive about filtering out non-speech
+WEBRTC_VAD_AGGRESSIVENESS = 2
+
+# With adaptive_threshold, VAD frames must also reach this fraction of the RMS
+# of the loudest frame heard in the last ADAPTIVE_THRESHOLD_SECONDS
+ADAPTIVE_THRESHOLD_RATIO = 0.3
+ADAPTIVE_THRESHOLD_SECONDS = 30
+
+# With silero_gate, finished VAD chunks are also run through the Silero VAD
+# model bundled with faster-whisper and dropped if it finds no speech
+SILERO_SPEECH_THRESHOLD = 0.2
+SILERO_MIN_SPEECH_MS = 250
+
+
+def vad_filter_options(vad_silence_duration):
+    """transcribe() options that run faster-whisper's own Silero VAD filter.
+    
+    The filter drops non-speech inside each chunk before decoding, using the
+    same speech threshold as the Silero gate and the VAD's silence duration.
+    """
+    return {
+        "vad_filter": True,
+        "vad_parameters": {
+            "threshold": SILERO_SPEECH_THRESHOLD,
+            "min_silence_duration_ms": int(vad_silence_duration * 1000),
+        },
+    }
+
+# Numba is optional; when installed the VAD frame loop is compiled to machine
+# code instead of running once per frame in the interpreter
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Why _vad_scan() stopped: end of the frames, or the current chunk is done
+VAD_SCAN_CONTINUE = 0
+VAD_SCAN_SILENCE = 1
+VAD_SCAN_MAX_DURATION = 2
+
+
+def _vad_scan(speech, in_speech, silence_frames, chunk_frames, silence_limit, max_frames):
+    """Run the VAD state machine over consecutive frames.
+    
+    `speech` flags each frame as speech or silence. Scanning stops after the
+    frame that ends the current chunk. Returns (frames_used, end_reason,
+    first_chunk_frame, in_speech, silence_frames, chunk_frames), where frames
+    from first_chunk_frame up to frames_used belong to the chunk (-1 if none).
+    """
+    first = 0 if in_speech else -1
+    for i in range(len(speech)):
+        if speech[i]:
+            if not in_speech:
+                in_speech = True
+                first = i
+            chunk_frames += 1
+            silence_frames = 0
+        elif in_speech:
+            # A pause inside speech stays in the chunk until it runs too long
+            chunk_frames += 1
+            silence_frames += 1
+            if silence_frames >= silence_limit:
+                return i + 1, VAD_SCAN_SILENCE, first, in_speech, silence_frames, chunk_frames
+        if chunk_frames >= max_frames:
+            return i + 1, VAD_SCAN_MAX_DURATION, first, in_speech, silence_frames, chunk_frames
+    return len(speech), VAD_SCAN_CONTINUE, first, in_speech, silence_frames, chunk_frames
+
+
+if njit is not None:
+    _vad_scan = njit(cache=True)(_vad_scan)
+    
+    @njit(cache=True)
+    def _frame_energies(samples, frame_size):
+        """Sum of squares of each complete frame, accumulated in int64."""
+        num_frames = len(samples) // frame_size
+        energies = np.empty(num_frames, dtype=np.float64)
+        for i in range(num_frames):
+            total = 0
+            for j in range(i * frame_size, (i + 1) * frame_size):
+                value = np.int64(samples[j])
+                total += value * value
+            energies[i] = total
+        return energies
+else:
+    def _frame_energies(samples, frame_size):
+        """Sum of squares of each complete frame, in one vectorized pass."""
+        num_frames = len(samples) // frame_size
+        frames = samples[:num_frames * frame_size].reshape(num_frames, frame_size).astype(np.float32)
+        return np.einsum('ij,ij->i', frames, frames)
+
+# Seconds of recorded audio buffered ahead of a slow consumer (e.g. Whisper on
+# a CPU) before the oldest audio is dropped
+AUDIO_QUEUE_SECONDS = 60
+
+# Chunks transcribed at once; faster-whisper releases the GIL while decoding,
+# so the next chunk can start while one is still running
+TRANSCRIBE_WORKERS = 2
+
+# Whisper device / compute type choices; "auto" is resolved by resolve_device()
+DEVICE_CHOICES = ['auto', 'cpu', 'cuda']
+COMPUTE_TYPE_CHOICES = ['auto', 'default', 'int8', 'int8_float16', 'float16', 'float32']
+
+
+def resolve_device(device="auto", compute_type="auto"):
+    """Pick the device and compute type to load Whisper with.
+    
+    "auto" uses CUDA when CTranslate2 can see a GPU. The compute type then
+    defaults to INT8 weights with FP16 activations on the GPU and INT8 on
+    the CPU, the fastest settings faster-whisper supports on each.
+    """
+    if device == "auto":
+        try:
+            import ctranslate2
+            device = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+        except Exception:
+            device = "cpu"
+    if compute_type == "auto":
+        compute_type = "int8_float16" if device == "cuda" else "int8"
+    return device, compute_type
+
+
+# On Windows every console child gets its own console host unless told not to,
+# which slows FFmpeg startup and flashes a window for each recording
+if platform.system() == "Windows":
+    _ffmpeg_startupinfo = subprocess.STARTUPINFO()
+    _ffmpeg_startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+    FFMPEG_POPEN_KWARGS = {
+        "creationflags": subprocess.CREATE_NO_WINDOW,
+        "startupinfo": _ffmpeg_startupinfo,
+    }
+else:
+    FFMPEG_POPEN_KWARGS = {}
+
+
+@functools.lru_cache(maxsize=None)
+def ffmpeg_audio_input_args(platform_name):
+    """Get FFmpeg's default microphone input arguments for a platform.
+    
+    On Linux this probes for ALSA with arecord, so results are cached for
+    the life of the process.
+    """
+    if platform_name == "linux":
+        # Try ALSA first, then PulseAudio
+        try:
+            subprocess.run(["arecord", "-l"], capture_output=True, check=True)
+            return ("-f", "alsa", "-i", "default")
+        except (subprocess.CalledProcessError, FileNotFoundError, PermissionError):
+            # arecord not available or failed, fall back to pulse
+            return ("-f", "pulse", "-i", "default")
+    elif platform_name == "darwin":  # macOS
+        return ("-f", "avfoundation", "-i", ":0")
+    elif platform_name == "windows":
+        return ("-f", "dshow", "-i", "audio=")
+    else:
+        # Fallback - might work on some systems
+        return ("-f", "pulse", "-i", "default")
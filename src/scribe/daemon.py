@@ -6,12 +6,13 @@ import sys
 import time
 import signal
 import threading
-import tempfile
 import subprocess
 import platform
 import queue
-import wave
+import math
+import collections
 import numpy as np
+from concurrent import futures
 from pathlib import Path
 from typing import Dict, Any, Optional
 import click
@@ -46,19 +47,35 @@ def setup_cudnn_path():
     except Exception as e:
         print(f"Warning: Error setting up cuDNN path: {e}", file=sys.stderr)
 
-# Set up cuDNN path before importing faster_whisper
-# Only run once to avoid repeated setup
-if "SCRIBE_CUDNN_SETUP" not in os.environ:
-    os.environ["SCRIBE_CUDNN_SETUP"] = "1"
-    setup_cudnn_path()
-
-from faster_whisper import WhisperModel
-
 # Handle both module and script execution
 try:
     from .ipc import ScribeIPCServer
+    from .audio import (
+        _load_whisper, webrtcvad, WEBRTC_VAD_AGGRESSIVENESS,
+        ADAPTIVE_THRESHOLD_RATIO, ADAPTIVE_THRESHOLD_SECONDS,
+        SILERO_SPEECH_THRESHOLD, SILERO_MIN_SPEECH_MS, vad_filter_options,
+        njit, _vad_scan, _frame_energies, VAD_SCAN_SILENCE, VAD_SCAN_MAX_DURATION,
+        AUDIO_QUEUE_SECONDS, TRANSCRIBE_WORKERS, DEVICE_CHOICES, COMPUTE_TYPE_CHOICES,
+        resolve_device, FFMPEG_POPEN_KWARGS, ffmpeg_audio_input_args,
+    )
 except ImportError:
     from scribe.ipc import ScribeIPCServer
+    from scribe.audio import (
+        _load_whisper, webrtcvad, WEBRTC_VAD_AGGRESSIVENESS,
+        ADAPTIVE_THRESHOLD_RATIO, ADAPTIVE_THRESHOLD_SECONDS,
+        SILERO_SPEECH_THRESHOLD, SILERO_MIN_SPEECH_MS, vad_filter_options,
+        njit, _vad_scan, _frame_energies, VAD_SCAN_SILENCE, VAD_SCAN_MAX_DURATION,
+        AUDIO_QUEUE_SECONDS, TRANSCRIBE_WORKERS, DEVICE_CHOICES, COMPUTE_TYPE_CHOICES,
+        resolve_device, FFMPEG_POPEN_KWARGS, ffmpeg_audio_input_args,
+    )
+
+
+def setup_cudnn_once():
+    """Run setup_cudnn_path() once per process tree."""
+    # Only run once to avoid repeated setup
+    if "SCRIBE_CUDNN_SETUP" not in os.environ:
+        os.environ["SCRIBE_CUDNN_SETUP"] = "1"
+        setup_cudnn_path()
 
 
 class StreamingRecorder:
@@ -66,12 +83,17 @@ class StreamingRecorder:
     
     def __init__(self, sample_rate=16000, channels=1, chunk_duration=5.0, 
                  overlap_duration=1.0, silence_threshold=0.01, debug=False,
-                 vad_mode=False, vad_silence_duration=0.5, vad_max_duration=30.0):
+                 vad_mode=False, vad_silence_duration=0.5, vad_max_duration=30.0,
+                 adaptive_threshold=False, silero_gate=False):
         self.sample_rate = sample_rate
         self.channels = channels
         self.chunk_duration = chunk_duration
         self.overlap_duration = overlap_duration
         self.silence_threshold = silence_threshold
+        # RMS > threshold is checked as sum of squares > n * (threshold * 32768)^2
+        # so the hot path needs no mean, sqrt or squared temporary
+        self.silence_energy_per_sample = (silence_threshold * 32768.0) ** 2
+        self.energy_scratch = np.empty(sample_rate // 10, dtype=np.float32)
         self.platform = platform.system().lower()
         self.debug = debug
         
@@ -79,25 +101,64 @@ class StreamingRecorder:
         self.vad_mode = vad_mode
         self.vad_silence_duration = vad_silence_duration
         self.vad_max_duration = vad_max_duration
+        # Recent VAD frame energies (a ring, 100 ms per entry) for the adaptive threshold
+        self.adaptive_threshold = adaptive_threshold
+        self.frame_energy_history = np.zeros(ADAPTIVE_THRESHOLD_SECONDS * 10)
+        self.frame_energy_index = 0
+        # Leading frames of the buffer whose energies are already in the history
+        self.frame_energies_recorded = 0
+        
+        # Silero VAD runs in faster-whisper's ONNX runtime, no torch needed
+        self.speech_timestamps = None
+        if silero_gate:
+            from faster_whisper.vad import get_speech_timestamps
+            self.speech_timestamps = get_speech_timestamps
         
         self.process = None
-        self.audio_queue = queue.Queue()
+        # Bounded so a consumer that stalls cannot grow memory without limit;
+        # the recording thread drops the oldest audio once it is full
+        # None in the queue wakes the consumer: an error, the end of FFmpeg's
+        # output, or stop_streaming() when stop_event is set
+        self.audio_queue = queue.Queue(maxsize=AUDIO_QUEUE_SECONDS * 10)  # 100 ms reads
+        # FFmpeg output is read straight into these reusable 100 ms buffers,
+        # which the consumer hands back once it has copied them out
+        self.audio_read_samples = sample_rate // 10
+        self.audio_pool = queue.Queue()
+        for _ in range(16):
+            self.audio_pool.put(np.empty(self.audio_read_samples, dtype=np.int16))
         self.stop_event = threading.Event()
         self.recording_thread = None
         
         # Calculate samples for chunks and overlap
         self.chunk_samples = int(sample_rate * chunk_duration)
         self.overlap_samples = int(sample_rate * overlap_duration)
-        self.buffer = np.array([], dtype=np.int16)
+        # Incoming audio goes into a preallocated ring buffer; chunks and
+        # frames are read back as views instead of reallocating per read
+        self.ring = np.empty(max(self.chunk_samples * 4, sample_rate * 5), dtype=np.int16)
+        self.ring_scratch = np.empty(0, dtype=np.int16)
+        self.ring_head = 0
+        self.buffer_len = 0
         
         # VAD state tracking
         self.vad_silence_samples = int(sample_rate * vad_silence_duration)
         self.vad_max_samples = int(sample_rate * vad_max_duration)
-        self.vad_frame_size = int(sample_rate * 0.1)  # 100ms frames for VAD analysis
+        self.vad_frame_size = sample_rate // 10  # 100ms frames for VAD analysis
+        # Chunk limits in whole frames, the unit _vad_scan() counts in
+        self.vad_silence_frames = math.ceil(self.vad_silence_samples / self.vad_frame_size)
+        self.vad_max_frames = math.ceil(self.vad_max_samples / self.vad_frame_size)
+        self.vad_frame_energy_threshold = self.silence_energy_per_sample * self.vad_frame_size
         self.vad_consecutive_silence_frames = 0
         self.vad_current_chunk_samples = 0
         self.vad_in_speech = False
-        self.vad_speech_buffer = np.array([], dtype=np.int16)
+        # Current VAD chunk, filled up to vad_current_chunk_samples
+        self.vad_speech_audio = np.empty(
+            min(self.vad_max_samples, sample_rate * 10) + self.vad_frame_size, dtype=np.int16)
+        
+        # WebRTC VAD only handles mono audio at these rates, in 10/20/30 ms frames
+        self.webrtc_vad = None
+        if vad_mode and webrtcvad is not None and channels == 1 and sample_rate in (8000, 16000, 32000, 48000):
+            self.webrtc_vad = webrtcvad.Vad(WEBRTC_VAD_AGGRESSIVENESS)
+            self.webrtc_subframe_bytes = sample_rate // 50 * 2  # 20 ms of int16
         
         # Debug counters
         self.debug_stats = {
@@ -108,7 +169,8 @@ class StreamingRecorder:
             'ffmpeg_errors': 0,
             'processing_errors': 0,
             'vad_chunks_by_silence': 0,
-            'vad_chunks_by_max_duration': 0
+            'vad_chunks_by_max_duration': 0,
+            'audio_reads_dropped': 0
         }
         
     def _debug_log(self, message):
@@ -118,29 +180,17 @@ class StreamingRecorder:
         
     def get_audio_input_args(self):
         """Get platform-specific FFmpeg audio input arguments for streaming."""
-        if self.platform == "linux":
-            try:
-                subprocess.run(["arecord", "-l"], capture_output=True, check=True)
-                return ["-f", "alsa", "-i", "default"]
-            except (subprocess.CalledProcessError, FileNotFoundError, PermissionError):
-                # arecord not available or failed, fall back to pulse
-                return ["-f", "pulse", "-i", "default"]
-        elif self.platform == "darwin":  # macOS
-            return ["-f", "avfoundation", "-i", ":0"]
-        elif self.platform == "windows":
-            return ["-f", "dshow", "-i", "audio="]
-        else:
-            return ["-f", "pulse", "-i", "default"]
+        return list(ffmpeg_audio_input_args(self.platform))
     
     def _recording_worker(self):
         """Worker thread for continuous audio recording."""
         cmd = ["ffmpeg", "-y"]
         cmd.extend(self.get_audio_input_args())
         cmd.extend([
+            "-f", "s16le",  # Raw PCM, no container header to skip
             "-acodec", "pcm_s16le",
             "-ar", str(self.sample_rate),
             "-ac", str(self.channels),
-            "-f", "wav",
             "pipe:1"  # Output to stdout
         ])
         
@@ -152,41 +202,33 @@ class StreamingRecorder:
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 stdin=subprocess.PIPE,
-                bufsize=0
+                bufsize=0,
+                **FFMPEG_POPEN_KWARGS
             )
             
             self._debug_log(f"FFmpeg process started with PID: {self.process.pid}")
             
-            # Skip WAV header (44 bytes)
-            header = self.process.stdout.read(44)
-            if len(header) < 44:
-                self._debug_log(f"Failed to read WAV header, got {len(header)} bytes")
-                return
-            
-            self._debug_log(f"WAV header read successfully ({len(header)} bytes)")
-            
             # Read audio data in small chunks
-            read_size = self.sample_rate * 2 // 10  # 0.1 second chunks
+            read_size = self.audio_read_samples * 2  # 0.1 second chunks
             self._debug_log(f"Reading audio in chunks of {read_size} bytes")
             
             while not self.stop_event.is_set() and self.process.poll() is None:
                 try:
-                    data = self.process.stdout.read(read_size)
-                    if not data:
+                    audio_data = self._read_audio()
+                    if audio_data is None:
                         self._debug_log("No data received from FFmpeg, breaking")
+                        if not self.stop_event.is_set():
+                            self._queue_audio(None)  # Signal end of audio
                         break
                     
-                    self.debug_stats['bytes_read'] += len(data)
-                    
-                    # Convert to numpy array
-                    audio_data = np.frombuffer(data, dtype=np.int16)
-                    self.audio_queue.put(audio_data)
+                    self.debug_stats['bytes_read'] += audio_data.nbytes
+                    self._queue_audio(audio_data)
                     
                 except Exception as e:
                     self._debug_log(f"Error reading audio data: {e}")
                     self.debug_stats['ffmpeg_errors'] += 1
                     if not self.stop_event.is_set():
-                        self.audio_queue.put(None)  # Signal error
+                        self._queue_audio(None)  # Signal error
                     break
             
             # Check if FFmpeg process ended with error
@@ -198,81 +240,181 @@ class StreamingRecorder:
         except Exception as e:
             self._debug_log(f"Fatal error in recording worker: {e}")
             self.debug_stats['ffmpeg_errors'] += 1
-            self.audio_queue.put(None)
+            self._queue_audio(None)
     
+    def _read_audio(self):
+        """Read the next 100 ms of samples from FFmpeg into a pooled buffer.
+        
+        Returns None once FFmpeg's output ends.
+        """
+        try:
+            audio_data = self.audio_pool.get_nowait()
+        except queue.Empty:
+            audio_data = np.empty(self.audio_read_samples, dtype=np.int16)
+            
+        # Pipe reads can come back short, so keep reading until the buffer
+        # is full; this also never splits a sample across two reads
+        view = memoryview(audio_data).cast('B')
+        filled = 0
+        while filled < len(view):
+            num_bytes = self.process.stdout.readinto(view[filled:])
+            if not num_bytes:
+                break
+            filled += num_bytes
+            
+        if filled == len(view):
+            return audio_data
+        self._release_audio(audio_data)
+        if filled < 2:
+            return None
+        return audio_data[:filled // 2].copy()
+        
+    def _release_audio(self, audio_data):
+        """Return a buffer from _read_audio() to the pool once consumed."""
+        if audio_data is not None and len(audio_data) == self.audio_read_samples:
+            self.audio_pool.put_nowait(audio_data)
+            
+    def _queue_audio(self, audio_data):
+        """Hand audio to the consumer, dropping the oldest if it fell behind."""
+        while True:
+            try:
+                self.audio_queue.put_nowait(audio_data)
+                return
+            except queue.Full:
+                try:
+                    self._release_audio(self.audio_queue.get_nowait())
+                    self.debug_stats['audio_reads_dropped'] += 1
+                except queue.Empty:
+                    pass
+                    
     def start_streaming(self):
         """Start continuous audio streaming."""
+        if self.vad_mode and njit is not None:
+            # Compile the VAD kernels now instead of on the first audio,
+            # with the same argument types get_next_vad_chunk() passes
+            frame = np.zeros(self.vad_frame_size, dtype=np.int16)
+            _vad_scan(_frame_energies(frame, self.vad_frame_size) > 0.0, False, 0, 0,
+                      self.vad_silence_frames, self.vad_max_frames)
+            
         self.stop_event.clear()
         self.recording_thread = threading.Thread(target=self._recording_worker)
         self.recording_thread.daemon = True
         self.recording_thread.start()
         
+    def _buffer_append(self, audio_data):
+        """Copy audio into the ring buffer, growing it if the reader fell behind."""
+        num_samples = len(audio_data)
+        if self.buffer_len + num_samples > len(self.ring):
+            self._grow_ring(self.buffer_len + num_samples)
+            
+        capacity = len(self.ring)
+        tail = (self.ring_head + self.buffer_len) % capacity
+        first = min(num_samples, capacity - tail)
+        self.ring[tail:tail + first] = audio_data[:first]
+        if first < num_samples:
+            self.ring[:num_samples - first] = audio_data[first:]
+        self.buffer_len += num_samples
+        
+    def _grow_ring(self, needed):
+        """Move the buffered samples into a larger ring."""
+        ring = np.empty(max(needed, 2 * len(self.ring)), dtype=np.int16)
+        first = min(self.buffer_len, len(self.ring) - self.ring_head)
+        ring[:first] = self.ring[self.ring_head:self.ring_head + first]
+        ring[first:self.buffer_len] = self.ring[:self.buffer_len - first]
+        self.ring = ring
+        self.ring_head = 0
+        
+    def _buffer_take(self, num_samples, keep=0):
+        """Remove num_samples from the front of the ring buffer.
+        
+        Returns a view into the ring, or a scratch copy when the samples wrap
+        around its end; either is only valid until the buffer is next used.
+        The last `keep` samples stay buffered, which is how chunk overlap is
+        carried over to the next chunk.
+        """
+        capacity = len(self.ring)
+        head = self.ring_head
+        if head + num_samples <= capacity:
+            chunk = self.ring[head:head + num_samples]
+        else:
+            if len(self.ring_scratch) < num_samples:
+                self.ring_scratch = np.empty(num_samples, dtype=np.int16)
+            chunk = self.ring_scratch[:num_samples]
+            first = capacity - head
+            chunk[:first] = self.ring[head:]
+            chunk[first:] = self.ring[:num_samples - first]
+            
+        self._buffer_drop(num_samples - keep)
+        return chunk
+        
+    def _buffer_drop(self, num_samples):
+        """Discard num_samples from the front of the ring buffer."""
+        self.ring_head = (self.ring_head + num_samples) % len(self.ring)
+        self.buffer_len -= num_samples
+        
+    def _speech_append(self, frame):
+        """Copy a frame onto the end of the current VAD chunk."""
+        start = self.vad_current_chunk_samples
+        end = start + len(frame)
+        if end > len(self.vad_speech_audio):
+            grown = np.empty(max(end, 2 * len(self.vad_speech_audio)), dtype=np.int16)
+            grown[:start] = self.vad_speech_audio[:start]
+            self.vad_speech_audio = grown
+        self.vad_speech_audio[start:end] = frame
+        self.vad_current_chunk_samples = end
+        
     def get_next_vad_chunk(self):
         """Get the next audio chunk using Voice Activity Detection."""
         while not self.stop_event.is_set():
             try:
                 # Get audio data from queue
-                try:
-                    audio_data = self.audio_queue.get(timeout=0.1)
-                    if audio_data is None:  # Error signal
+                audio_data = self.audio_queue.get()
+                if audio_data is None:
+                    if not self.stop_event.is_set():
                         self._debug_log("Received error signal from recording thread")
                         return None
-                    
-                    # Add to main buffer for frame-by-frame analysis
-                    self.buffer = np.concatenate([self.buffer, audio_data])
-                    
-                except queue.Empty:
-                    continue
+                    break
+                
+                # Add to main buffer for frame-by-frame analysis
+                self._buffer_append(audio_data)
+                self._release_audio(audio_data)
                 
-                # Process audio in frames for VAD analysis
-                while len(self.buffer) >= self.vad_frame_size:
-                    # Extract frame
-                    frame = self.buffer[:self.vad_frame_size]
-                    self.buffer = self.buffer[self.vad_frame_size:]
+                # Classify all complete frames at once, then scan them up to
+                # the frame that ends the current chunk
+                frame_size = self.vad_frame_size
+                while self.buffer_len >= frame_size:
+                    num_samples = self.buffer_len // frame_size * frame_size
+                    samples = self._buffer_take(num_samples, keep=num_samples)
+                    speech = self._frames_have_speech(samples)
+                    
+                    was_in_speech = self.vad_in_speech
+                    (frames_used, end_reason, first_frame, self.vad_in_speech,
+                     self.vad_consecutive_silence_frames, _) = _vad_scan(
+                        speech, self.vad_in_speech, self.vad_consecutive_silence_frames,
+                        self.vad_current_chunk_samples // frame_size,
+                        self.vad_silence_frames, self.vad_max_frames)
                     
-                    # Analyze frame for speech/silence
-                    frame_has_speech = self._has_audio(frame)
+                    if self.vad_in_speech and not was_in_speech:
+                        self._debug_log("VAD: Speech started")
+                    if first_frame >= 0:
+                        self._speech_append(samples[first_frame * frame_size:frames_used * frame_size])
+                    self._buffer_drop(frames_used * frame_size)
+                    self.frame_energies_recorded = max(0, self.frame_energies_recorded - frames_used)
                     
-                    if frame_has_speech:
-                        # Speech detected
-                        if not self.vad_in_speech:
-                            self._debug_log("VAD: Speech started")
-                            self.vad_in_speech = True
-                        
-                        # Add frame to speech buffer
-                        self.vad_speech_buffer = np.concatenate([self.vad_speech_buffer, frame])
-                        self.vad_current_chunk_samples += len(frame)
-                        self.vad_consecutive_silence_frames = 0
-                        
-                    else:
-                        # Silence detected
-                        if self.vad_in_speech:
-                            # We were in speech, now silence
-                            self.vad_consecutive_silence_frames += 1
-                            silence_duration = self.vad_consecutive_silence_frames * self.vad_frame_size / self.sample_rate
-                            
-                            self._debug_log(f"VAD: Silence frame {self.vad_consecutive_silence_frames}, "
-                                          f"duration: {silence_duration:.2f}s")
-                            
-                            # Add silence frame to buffer (we might still be in a pause)
-                            self.vad_speech_buffer = np.concatenate([self.vad_speech_buffer, frame])
-                            self.vad_current_chunk_samples += len(frame)
-                            
-                            # Check if silence duration exceeded threshold
-                            if silence_duration >= self.vad_silence_duration:
-                                self._debug_log("VAD: Silence threshold exceeded, ending chunk")
-                                chunk = self._finalize_vad_chunk("silence")
-                                if chunk:
-                                    return chunk
-                        else:
-                            # We're in silence, continue
-                            pass
+                    if self.debug and self.vad_consecutive_silence_frames:
+                        silence_duration = self.vad_consecutive_silence_frames * frame_size / self.sample_rate
+                        self._debug_log(f"VAD: Silence frame {self.vad_consecutive_silence_frames}, "
+                                      f"duration: {silence_duration:.2f}s")
                     
-                    # Check maximum duration failsafe
-                    if self.vad_current_chunk_samples >= self.vad_max_samples:
+                    if end_reason == VAD_SCAN_SILENCE:
+                        self._debug_log("VAD: Silence threshold exceeded, ending chunk")
+                        chunk = self._finalize_vad_chunk("silence")
+                        if chunk is not None:
+                            return chunk
+                    elif end_reason == VAD_SCAN_MAX_DURATION:
                         self._debug_log("VAD: Maximum duration reached, ending chunk")
                         chunk = self._finalize_vad_chunk("max_duration")
-                        if chunk:
+                        if chunk is not None:
                             return chunk
                     
             except Exception as e:
@@ -281,10 +423,10 @@ class StreamingRecorder:
                 continue
         
         # If we're exiting and have accumulated speech, return it
-        if len(self.vad_speech_buffer) > 0:
+        if self.vad_current_chunk_samples > 0:
             self._debug_log("VAD: Returning final chunk on exit")
             chunk = self._finalize_vad_chunk("exit")
-            if chunk:
+            if chunk is not None:
                 return chunk
         
         self._debug_log("get_next_vad_chunk exiting due to stop event")
@@ -292,11 +434,20 @@ class StreamingRecorder:
     
     def _finalize_vad_chunk(self, reason):
         """Finalize and return a VAD chunk."""
-        if len(self.vad_speech_buffer) == 0:
+        if self.vad_current_chunk_samples == 0:
             return None
         
+        speech_audio = self.vad_speech_audio[:self.vad_current_chunk_samples]
+        
         # Determine if chunk has enough audio content
-        if self._has_audio(self.vad_speech_buffer):
+        chunk_audio = None
+        if self._has_audio(speech_audio):
+            # Convert now, speech_audio is a view that the next chunk reuses
+            chunk_audio = self._to_whisper_audio(speech_audio)
+            if self.speech_timestamps is not None and not self._silero_has_speech(chunk_audio):
+                chunk_audio = None
+                
+        if chunk_audio is not None:
             self.debug_stats['total_chunks_processed'] += 1
             self.debug_stats['chunks_with_audio'] += 1
             
@@ -305,59 +456,107 @@ class StreamingRecorder:
             elif reason == "max_duration":
                 self.debug_stats['vad_chunks_by_max_duration'] += 1
             
-            # Save chunk to temporary file
-            temp_file = tempfile.NamedTemporaryFile(suffix='.wav', delete=False)
-            self._save_chunk_to_file(self.vad_speech_buffer, temp_file.name)
-            temp_file.close()
-            
-            chunk_duration = len(self.vad_speech_buffer) / self.sample_rate
-            
-            self._debug_log(f"VAD Chunk {self.debug_stats['total_chunks_processed']}: "
-                          f"duration={chunk_duration:.2f}s, samples={len(self.vad_speech_buffer)}, "
-                          f"reason={reason}, saved to {temp_file.name}")
+            if self.debug:
+                chunk_duration = len(speech_audio) / self.sample_rate
+                self._debug_log(f"VAD Chunk {self.debug_stats['total_chunks_processed']}: "
+                              f"duration={chunk_duration:.2f}s, samples={len(speech_audio)}, "
+                              f"reason={reason}")
             
             # Reset VAD state
-            self.vad_speech_buffer = np.array([], dtype=np.int16)
             self.vad_current_chunk_samples = 0
             self.vad_consecutive_silence_frames = 0
             self.vad_in_speech = False
             
-            return temp_file.name
+            return chunk_audio
         else:
             # Chunk doesn't have enough audio, skip it
             self.debug_stats['total_chunks_processed'] += 1
             self.debug_stats['chunks_skipped_silence'] += 1
             
-            self._debug_log(f"VAD Chunk {self.debug_stats['total_chunks_processed']}: "
-                          f"skipped (insufficient audio), reason={reason}")
+            if self.debug:
+                self._debug_log(f"VAD Chunk {self.debug_stats['total_chunks_processed']}: "
+                              f"skipped (insufficient audio), reason={reason}")
             
             # Reset VAD state
-            self.vad_speech_buffer = np.array([], dtype=np.int16)
             self.vad_current_chunk_samples = 0
             self.vad_consecutive_silence_frames = 0
             self.vad_in_speech = False
             
             return None
     
+    def _silero_has_speech(self, chunk_audio):
+        """Second-pass check of a finished chunk with the Silero VAD model."""
+        speech = self.speech_timestamps(chunk_audio, threshold=SILERO_SPEECH_THRESHOLD,
+                                        min_speech_duration_ms=SILERO_MIN_SPEECH_MS)
+        if not speech:
+            self._debug_log("Silero VAD found no speech in chunk")
+        return bool(speech)
+        
+    def _frames_have_speech(self, samples):
+        """Classify each complete VAD frame in samples as speech or silence.
+        
+        Frames must pass the energy check; with webrtcvad installed, one of
+        their 20 ms subframes must also be classified as speech.
+        """
+        frame_size = self.vad_frame_size
+        energies = _frame_energies(samples, frame_size)
+        threshold = self.vad_frame_energy_threshold
+        if self.adaptive_threshold:
+            threshold = max(threshold, self._adaptive_frame_threshold(energies))
+        speech = energies > threshold
+        if self.webrtc_vad is None:
+            return speech
+            
+        step = self.webrtc_subframe_bytes
+        for i in np.flatnonzero(speech):
+            # A byte view of the frame; slicing it below copies nothing
+            data = memoryview(samples[i * frame_size:(i + 1) * frame_size]).cast('B')
+            speech[i] = any(self.webrtc_vad.is_speech(data[j:j + step], self.sample_rate)
+                            for j in range(0, len(data) - step + 1, step))
+        return speech
+        
+    def _adaptive_frame_threshold(self, energies):
+        """Record new frame energies and return the adaptive frame energy threshold.
+        
+        This is S_e = ratio * max(E) over the recent history of frame RMS,
+        squared to compare against frame energies. `energies` covers every
+        complete frame in the buffer; frames left over from the last scan are
+        already recorded, so only the ones after them are added.
+        """
+        history = self.frame_energy_history
+        recorded = self.frame_energies_recorded
+        self.frame_energies_recorded = len(energies)
+        energies = energies[recorded:][-len(history):]
+        history.put(range(self.frame_energy_index, self.frame_energy_index + len(energies)),
+                    energies, mode='wrap')
+        self.frame_energy_index = (self.frame_energy_index + len(energies)) % len(history)
+        return ADAPTIVE_THRESHOLD_RATIO ** 2 * float(history.max())
+        
     def _has_audio(self, audio_data):
         """Check if audio chunk contains significant audio (not just silence)."""
-        # Calculate RMS (root mean square) to detect audio
-        rms = np.sqrt(np.mean(audio_data.astype(np.float32) ** 2))
-        normalized_rms = rms / 32768.0  # Normalize to 0-1 range
-        
-        return normalized_rms > self.silence_threshold
+        # Compare energy (sum of squares, one BLAS dot) instead of RMS,
+        # converting into a reused float32 scratch rather than a new array
+        if len(self.energy_scratch) < len(audio_data):
+            self.energy_scratch = np.empty(len(audio_data), dtype=np.float32)
+        samples = self.energy_scratch[:len(audio_data)]
+        np.copyto(samples, audio_data)
+        energy = float(np.dot(samples, samples))
+        return energy > self.silence_energy_per_sample * len(samples)
     
-    def _save_chunk_to_file(self, audio_data, filename):
-        """Save audio chunk to WAV file."""
-        with wave.open(filename, 'wb') as wav_file:
-            wav_file.setnchannels(self.channels)
-            wav_file.setsampwidth(2)  # 16-bit
-            wav_file.setframerate(self.sample_rate)
-            wav_file.writeframes(audio_data.tobytes())
+    def _to_whisper_audio(self, audio_data):
+        """Convert int16 samples to the float32 array faster-whisper accepts.
+        
+        Passing the array skips writing a WAV file and having faster-whisper
+        decode it again. Whisper expects 16 kHz mono, which is what FFmpeg is
+        asked to produce.
+        """
+        # One ufunc pass straight into the float32 result, no int->float temporary
+        return np.multiply(audio_data, np.float32(1.0 / 32768.0), dtype=np.float32)
     
     def stop_streaming(self):
         """Stop continuous audio streaming."""
         self.stop_event.set()
+        self._queue_audio(None)  # Wake a consumer waiting for audio
         
         if self.process:
             try:
@@ -398,6 +597,11 @@ class ScribeDaemon:
             "silence_threshold": 0.01,
             "vad_silence_duration": 0.5,
             "vad_max_duration": 30.0,
+            "adaptive_threshold": False,
+            "silero_gate": False,
+            "vad_filter": False,
+            "device": "auto",
+            "compute_type": "auto",
             "debug": False
         }
         
@@ -412,6 +616,12 @@ class ScribeDaemon:
         self.transcription_thread = None
         self.transcription_stop_event = threading.Event()
         
+        # Chunks being transcribed, broadcast in order as they finish
+        self.transcription_executor = None
+        self.transcription_slots = threading.BoundedSemaphore(TRANSCRIBE_WORKERS * 2)
+        self.pending_transcriptions = collections.deque()
+        self.transcription_lock = threading.Lock()
+        
     def start(self):
         """Start the daemon."""
         print("Starting Scribe daemon...", file=sys.stderr)
@@ -461,11 +671,15 @@ class ScribeDaemon:
         
     def _load_model(self, model_name: str):
         """Load Whisper model."""
-        print(f"Loading Whisper model: {model_name}", file=sys.stderr)
         start_time = time.time()
         
         try:
-            self.whisper_model = WhisperModel(model_name, device="auto")
+            # Import faster-whisper first so CTranslate2 loads with cuDNN set up
+            WhisperModel, _ = _load_whisper()
+            device, compute_type = resolve_device(self.config["device"], self.config["compute_type"])
+            print(f"Loading Whisper model: {model_name} ({device}, {compute_type})", file=sys.stderr)
+            self.whisper_model = WhisperModel(model_name, device=device, compute_type=compute_type,
+                                              num_workers=TRANSCRIBE_WORKERS)
             load_time = time.time() - start_time
             print(f"Model loaded in {load_time:.2f}s", file=sys.stderr)
         except Exception as e:
@@ -543,13 +757,17 @@ class ScribeDaemon:
             debug=self.config["debug"],
             vad_mode=True,
             vad_silence_duration=self.config["vad_silence_duration"],
-            vad_max_duration=self.config["vad_max_duration"]
+            vad_max_duration=self.config["vad_max_duration"],
+            adaptive_threshold=self.config["adaptive_threshold"],
+            silero_gate=self.config["silero_gate"]
         )
         
         # Start recording
         self.recorder.start_streaming()
         
         # Start transcription processing thread
+        self.transcription_executor = futures.ThreadPoolExecutor(
+            max_workers=TRANSCRIBE_WORKERS, thread_name_prefix="scribe-transcribe")
         self.transcription_stop_event.clear()
         self.transcription_thread = threading.Thread(target=self._transcription_worker, daemon=True)
         self.transcription_thread.start()
@@ -566,15 +784,21 @@ class ScribeDaemon:
         
         self.recording = False
         
-        # Stop transcription thread
+        # Stop recorder first; this wakes the transcription thread
+        if self.recorder:
+            self.recorder.cleanup()
+        
+        # Stop transcription thread once it has submitted the final chunk
         self.transcription_stop_event.set()
         if self.transcription_thread:
-            self.transcription_thread.join(timeout=2)
+            self.transcription_thread.join()
+            self.transcription_thread = None
+        self.recorder = None
         
-        # Stop recorder
-        if self.recorder:
-            self.recorder.cleanup()
-            self.recorder = None
+        # Let chunks already recorded finish, so their text arrives first
+        if self.transcription_executor:
+            self.transcription_executor.shutdown(wait=True)
+            self.transcription_executor = None
         
         # Notify clients
         self.ipc_server.broadcast_message({
@@ -587,38 +811,30 @@ class ScribeDaemon:
     def _transcription_worker(self):
         """Process audio chunks and transcribe them."""
         print("Starting transcription worker...", file=sys.stderr)
+        recorder = self.recorder
+        executor = self.transcription_executor
         
-        while not self.transcription_stop_event.is_set() and self.recording:
+        while True:
             try:
-                # Get next audio chunk
-                chunk_file = self.recorder.get_next_vad_chunk()
-                if chunk_file is None:
+                # Get next audio chunk; after the recorder stops this returns
+                # the final chunk, then None
+                chunk_audio = recorder.get_next_vad_chunk()
+                if chunk_audio is None:
+                    if recorder.stop_event.is_set() or self.transcription_stop_event.is_set():
+                        break
                     continue
                 
-                # Transcribe chunk
-                start_time = time.time()
-                segments, info = self.whisper_model.transcribe(
-                    chunk_file, 
-                    language=self.config["language"]
-                )
-                
-                transcription_time = time.time() - start_time
-                
-                # Send transcription to clients
-                for segment in segments:
-                    if segment.text.strip():
-                        self.ipc_server.broadcast_message({
-                            "type": "transcription",
-                            "text": segment.text.strip(),
-                            "transcription_time": transcription_time
-                        })
-                
-                # Clean up chunk file
+                # Transcribe in the background and go back to listening
+                self.transcription_slots.acquire()
                 try:
-                    os.unlink(chunk_file)
-                except (FileNotFoundError, PermissionError, OSError) as e:
-                    # Log specific errors for temp file cleanup issues
-                    print(f"Warning: Could not clean up temp file {chunk_file}: {e}", file=sys.stderr)
+                    future = executor.submit(self._transcribe, chunk_audio)
+                except RuntimeError:
+                    # Recording stopped and the executor has shut down
+                    self.transcription_slots.release()
+                    break
+                with self.transcription_lock:
+                    self.pending_transcriptions.append(future)
+                future.add_done_callback(self._broadcast_transcriptions)
                     
             except Exception as e:
                 print(f"Transcription error: {e}", file=sys.stderr)
@@ -626,9 +842,53 @@ class ScribeDaemon:
                     "type": "error",
                     "message": f"Transcription error: {e}"
                 })
-                continue
+                if recorder.stop_event.is_set():
+                    break
                 
         print("Transcription worker stopped", file=sys.stderr)
+        
+    def _transcribe(self, chunk_audio):
+        """Transcribe one chunk, returning its segment texts and the time taken."""
+        start_time = time.time()
+        options = {}
+        if self.config["vad_filter"]:
+            options = vad_filter_options(self.config["vad_silence_duration"])
+        segments, info = self.whisper_model.transcribe(
+            chunk_audio, 
+            language=self.config["language"],
+            **options
+        )
+        # Segments are decoded lazily, so iterate them here on the worker
+        texts = [segment.text.strip() for segment in segments]
+        return texts, time.time() - start_time
+        
+    def _broadcast_transcriptions(self, _):
+        """Broadcast every finished chunk at the front of the submission order."""
+        with self.transcription_lock:
+            while self.pending_transcriptions and self.pending_transcriptions[0].done():
+                future = self.pending_transcriptions.popleft()
+                self.transcription_slots.release()
+                
+                try:
+                    texts, transcription_time = future.result()
+                except Exception as e:
+                    print(f"Transcription error: {e}", file=sys.stderr)
+                    self.ipc_server.broadcast_message({
+                        "type": "error",
+                        "message": f"Transcription error: {e}"
+                    })
+                    continue
+                    
+                # Send the chunk's transcriptions to clients in one write
+                self.ipc_server.broadcast_messages([
+                    {
+                        "type": "transcription",
+                        "text": text,
+                        "transcription_time": transcription_time
+                    }
+                    for text in texts
+                    if text
+                ])
 
 
 @click.command()
@@ -636,11 +896,20 @@ class ScribeDaemon:
 @click.option('--model', default='base', 
               type=click.Choice(['tiny', 'base', 'small', 'medium', 'large', 'turbo']),
               help='Default Whisper model to load')
+@click.option('--device', default='auto', type=click.Choice(DEVICE_CHOICES),
+              help='Device to run Whisper on (auto uses CUDA when a GPU is available)')
+@click.option('--compute-type', default='auto', type=click.Choice(COMPUTE_TYPE_CHOICES),
+              help='Whisper weight/compute precision (auto: int8_float16 on CUDA, int8 on CPU)')
 @click.option('--debug', is_flag=True, help='Enable debug output')
-def main(socket_path, model, debug):
+def main(socket_path, model, device, compute_type, debug):
     """Start the Scribe daemon."""
+    # Set up cuDNN path before the IPC server starts listening
+    setup_cudnn_once()
+    
     daemon = ScribeDaemon(socket_path)
     daemon.config["model"] = model
+    daemon.config["device"] = device
+    daemon.config["compute_type"] = compute_type
     daemon.config["debug"] = debug
     
     try:
@@ -4,11 +4,53 @@
 import gi
 gi.require_version('Gtk', '3.0')
 from gi.repository import Gtk, GObject, GLib
+import codecs
 import subprocess
-import threading
 import os
+import queue
+import select
+import shlex
 import signal
 import time
+from concurrent import futures
+
+# Handle both module and script execution
+try:
+    from .gui_common import trim_log_buffer, validate_threshold_entry
+except ImportError:
+    from scribe.gui_common import trim_log_buffer, validate_threshold_entry
+
+
+# Monitor and output writer loops run on a shared pool so repeated
+# start/stop cycles reuse threads instead of spawning new ones
+_EXECUTOR = futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix="scribe")
+
+# Transcriptions buffered for the output command before new ones are dropped
+OUTPUT_QUEUE_SIZE = 1024
+
+# Seconds to wait after the stop signal before SIGTERM, and after that SIGKILL
+STOP_TERM_AFTER_SECONDS = 3
+STOP_KILL_AFTER_SECONDS = 2
+
+# Characters that only mean something to a shell
+SHELL_OPERATOR_CHARS = set("();<>|&")
+
+
+def parse_output_command(command):
+    """Split an output command into an argv list.
+    
+    Returns (argv, needs_shell). Commands using shell syntax such as
+    redirection or pipes cannot be run directly and are flagged so the
+    caller can fall back to the shell for them.
+    """
+    lexer = shlex.shlex(command, posix=True, punctuation_chars=True)
+    lexer.whitespace_split = True
+    tokens = list(lexer)
+    needs_shell = ("$" in command or "`" in command or
+                   any(token and set(token) <= SHELL_OPERATOR_CHARS for token in tokens))
+    if needs_shell:
+        return None, True
+    return shlex.split(command), False
 
 
 class ScribeGUI:
@@ -17,7 +59,12 @@ class ScribeGUI:
         self.scribe_process = None
         self.output_process = None
         self.is_running = False
-        self.monitor_thread = None
+        self.monitor_future = None
+        
+        # Transcriptions are handed to the output command by a writer thread
+        self.output_queue = None
+        self.output_future = None
+        self.output_dropped = 0
         
         # Process logging flags to prevent repetitive messages
         self.scribe_process_logged = False
@@ -101,6 +148,8 @@ class ScribeGUI:
         self.threshold_entry.set_text("0.002")
         self.threshold_entry.set_max_width_chars(10)
         self.threshold_entry.set_placeholder_text("0.002")
+        self.threshold_entry.connect("changed", self.on_threshold_changed)
+        self.on_threshold_changed(self.threshold_entry)
         threshold_box.pack_start(self.threshold_entry, False, False, 0)
         
         # Add helper text
@@ -167,6 +216,11 @@ class ScribeGUI:
         self.log_textview.set_editable(False)
         self.log_textview.set_cursor_visible(False)
         self.log_buffer = self.log_textview.get_buffer()
+        # Bound once, log_message runs for every line of output
+        self._log_end_iter = self.log_buffer.get_end_iter
+        self._log_insert = self.log_buffer.insert
+        self._log_scroll = self.log_textview.scroll_mark_onscreen
+        self._log_mark = self.log_buffer.get_insert()
         scrolled_window.add(self.log_textview)
         log_box.pack_start(scrolled_window, True, True, 0)
         
@@ -181,15 +235,19 @@ class ScribeGUI:
     def log_message(self, message):
         """Add a message to the log output."""
         def update_log():
-            end_iter = self.log_buffer.get_end_iter()
-            self.log_buffer.insert(end_iter, f"{message}\n")
+            self._log_insert(self._log_end_iter(), f"{message}\n")
+            
+            trim_log_buffer(self.log_buffer)
             
             # Auto-scroll to bottom
-            mark = self.log_buffer.get_insert()
-            self.log_textview.scroll_mark_onscreen(mark)
+            self._log_scroll(self._log_mark)
             
         GLib.idle_add(update_log)
         
+    def on_threshold_changed(self, entry):
+        """Validate the silence threshold as it is typed, not when starting."""
+        self.silence_threshold, self.threshold_error = validate_threshold_entry(entry)
+        
     def on_clear_log_clicked(self, button):
         """Clear the log output."""
         self.log_buffer.set_text("")
@@ -216,22 +274,26 @@ class ScribeGUI:
             scribe_cmd.append("--batch")
         else:
             # Add silence threshold for streaming mode only
-            threshold_text = self.threshold_entry.get_text().strip()
-            if threshold_text:
-                try:
-                    threshold_value = float(threshold_text)
-                    if 0.0001 <= threshold_value <= 1.0:
-                        scribe_cmd.extend(["--silence-threshold", str(threshold_value)])
-                    else:
-                        self.log_message(f"Warning: Silence threshold {threshold_value} outside recommended range (0.0001-1.0), using default")
-                except ValueError:
-                    self.log_message(f"Warning: Invalid silence threshold '{threshold_text}', using default")
+            # Already validated by on_threshold_changed
+            if self.silence_threshold is not None:
+                scribe_cmd.extend(["--silence-threshold", str(self.silence_threshold)])
+            elif self.threshold_error:
+                self.log_message(f"Warning: Silence threshold {self.threshold_error}, using default")
             
         # Add verbose output
         scribe_cmd.append("--verbose")
         
         # Get output command
         output_cmd = self.output_entry.get_text().strip()
+        output_argv = None
+        output_shell = False
+        if output_cmd:
+            try:
+                output_argv, output_shell = parse_output_command(output_cmd)
+            except ValueError as e:
+                self.log_message(f"Invalid output command '{output_cmd}': {e}")
+                self.show_error_dialog("Error", f"Invalid output command: {e}")
+                return
         
         self.log_message(f"Starting Scribe with command: {' '.join(scribe_cmd)}")
         if output_cmd:
@@ -243,27 +305,34 @@ class ScribeGUI:
             self.output_process_logged = False
             
             # Start the process chain
+            # Pipes are read as raw non-blocking fds by monitor_processes.
+            # Each child gets its own process group so stopping reaches
+            # everything it spawned (uv runs scribe as a grandchild).
             self.scribe_process = subprocess.Popen(
                 scribe_cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1,
-                universal_newlines=True
+                start_new_session=True
             )
             
-            # Start output process if specified
+            # Start output process if specified; scribe's stdout stays with the
+            # monitor thread, which forwards it through the output queue
             if output_cmd:
                 self.output_process = subprocess.Popen(
-                    output_cmd,
-                    shell=True,
-                    stdin=self.scribe_process.stdout,
+                    output_cmd if output_shell else output_argv,
+                    shell=output_shell,
+                    stdin=subprocess.PIPE,
                     stdout=subprocess.PIPE,
                     stderr=subprocess.PIPE,
-                    text=True
+                    text=True,
+                    bufsize=1,
+                    start_new_session=True
+                )
+                self.output_queue = queue.Queue(maxsize=OUTPUT_QUEUE_SIZE)
+                self.output_dropped = 0
+                self.output_future = _EXECUTOR.submit(
+                    self._output_writer, self.output_process, self.output_queue
                 )
-                # Allow scribe_process to receive a SIGPIPE if output_process exits
-                self.scribe_process.stdout.close()
             
             self.is_running = True
             self.start_button.set_sensitive(False)
@@ -271,8 +340,7 @@ class ScribeGUI:
             self.status_label.set_text("Status: Running")
             
             # Start monitoring thread
-            self.monitor_thread = threading.Thread(target=self.monitor_processes, daemon=True)
-            self.monitor_thread.start()
+            self.monitor_future = _EXECUTOR.submit(self.monitor_processes)
             
         except Exception as e:
             self.log_message(f"Error starting Scribe: {e}")
@@ -289,60 +357,47 @@ class ScribeGUI:
         self.stop_button.set_sensitive(False)
         self.status_label.set_text("Status: Stopping...")
         
-        # Start asynchronous stop process
-        stop_thread = threading.Thread(target=self._stop_processes_async, daemon=True)
-        stop_thread.start()
+        # Signal now and escalate from main loop timers; monitor_processes
+        # notices the exit and cleans up, so nothing here blocks on wait()
+        scribe_process = self.scribe_process
+        output_process = self.output_process
         
-    def _stop_processes_async(self):
-        """Asynchronously stop processes without blocking the UI."""
-        try:
-            # Send SIGINT to scribe process (equivalent to Ctrl+C)
-            if self.scribe_process and self.scribe_process.poll() is None:
-                self.scribe_process.send_signal(signal.SIGINT)
-                self.log_message("Sent stop signal to Scribe process...")
-                
-            # Terminate output process
-            if self.output_process and self.output_process.poll() is None:
-                self.output_process.terminate()
-                self.log_message("Terminating output process...")
-                
-            # Wait for scribe process to finish with progressive escalation
-            if self.scribe_process:
-                try:
-                    self.scribe_process.wait(timeout=3)
-                    self.log_message("Scribe process stopped gracefully")
-                except subprocess.TimeoutExpired:
-                    self.log_message("Scribe process didn't stop gracefully, sending SIGTERM...")
-                    self.scribe_process.terminate()
-                    try:
-                        self.scribe_process.wait(timeout=2)
-                        self.log_message("Scribe process terminated")
-                    except subprocess.TimeoutExpired:
-                        self.log_message("Force killing Scribe process...")
-                        self.scribe_process.kill()
-                        self.scribe_process.wait()
-                        
-            # Wait for output process to finish
-            if self.output_process:
-                try:
-                    self.output_process.wait(timeout=1)
-                    self.log_message("Output process stopped")
-                except subprocess.TimeoutExpired:
-                    self.log_message("Force killing output process...")
-                    self.output_process.kill()
-                    self.output_process.wait()
-                    
-            # Wait for monitor thread to finish
-            if self.monitor_thread and self.monitor_thread.is_alive():
-                self.monitor_thread.join(timeout=1)
-                if self.monitor_thread.is_alive():
-                    self.log_message("Monitor thread still running (will be cleaned up)")
-                    
-        except Exception as e:
-            self.log_message(f"Error stopping processes: {e}")
+        # SIGINT is equivalent to Ctrl+C and lets scribe finish the current chunk
+        if self._signal_group(scribe_process, signal.SIGINT):
+            self.log_message("Sent stop signal to Scribe process...")
+        if self._signal_group(output_process, signal.SIGTERM):
+            self.log_message("Terminating output process...")
             
-        # Clean up and update UI
-        GLib.idle_add(self.cleanup_processes)
+        GLib.timeout_add_seconds(STOP_TERM_AFTER_SECONDS, self._escalate_stop,
+                                 scribe_process, output_process)
+        
+    def _signal_group(self, process, sig):
+        """Send a signal to a child's process group.
+        
+        Returns False when the process has already exited.
+        """
+        if process is None or process.poll() is not None:
+            return False
+        try:
+            os.killpg(process.pid, sig)
+        except ProcessLookupError:
+            return False
+        return True
+        
+    def _escalate_stop(self, scribe_process, output_process):
+        """Terminate processes still running after the stop signal."""
+        if self._signal_group(output_process, signal.SIGKILL):
+            self.log_message("Force killing output process...")
+        if self._signal_group(scribe_process, signal.SIGTERM):
+            self.log_message("Scribe process didn't stop gracefully, sending SIGTERM...")
+            GLib.timeout_add_seconds(STOP_KILL_AFTER_SECONDS, self._kill_process, scribe_process)
+        return False  # One-shot timeout
+        
+    def _kill_process(self, process):
+        """Kill a process that ignored SIGTERM."""
+        if self._signal_group(process, signal.SIGKILL):
+            self.log_message("Force killing Scribe process...")
+        return False  # One-shot timeout
         
     def cleanup_processes(self):
         """Clean up process state."""
@@ -350,49 +405,143 @@ class ScribeGUI:
             self.is_running = False
             self.scribe_process = None
             self.output_process = None
+            self.output_queue = None
+            self.output_future = None
             self.start_button.set_sensitive(True)
             self.stop_button.set_sensitive(False)
             self.status_label.set_text("Status: Stopped")
             
         GLib.idle_add(update_ui)
         
+    def _output_writer(self, process, output_queue):
+        """Write queued transcriptions to the output command's stdin."""
+        try:
+            while True:
+                text = output_queue.get()
+                if text is None:
+                    break
+                process.stdin.write(text)
+                process.stdin.flush()
+        except (BrokenPipeError, OSError, ValueError) as e:
+            self.log_message(f"Output command stopped accepting input: {e}")
+        finally:
+            try:
+                process.stdin.close()
+            except (BrokenPipeError, OSError):
+                pass
+            
+        if self.output_dropped:
+            self.log_message(f"Dropped {self.output_dropped} transcription(s), output command was not keeping up")
+            
+    def _queue_output(self, text):
+        """Hand text to the output writer without blocking the monitor thread."""
+        try:
+            self.output_queue.put_nowait(text)
+        except queue.Full:
+            self.output_dropped += 1
+            
+    def _finish_output(self):
+        """Tell the output writer that no more text is coming."""
+        while self.output_queue is not None:
+            try:
+                self.output_queue.put_nowait(None)
+                return
+            except queue.Full:
+                # Make room for the sentinel, the writer is stuck anyway
+                try:
+                    self.output_queue.get_nowait()
+                    self.output_dropped += 1
+                except queue.Empty:
+                    pass
+                    
+    def _open_monitor_streams(self):
+        """Switch the scribe pipes to non-blocking mode for the monitor thread."""
+        streams = {}
+        for pipe, prefix, line_mode in ((self.scribe_process.stdout, "Transcription", False),
+                                        (self.scribe_process.stderr, "Scribe", True)):
+            if pipe is None or pipe.closed:
+                continue
+            fd = pipe.fileno()
+            os.set_blocking(fd, False)
+            streams[fd] = {
+                "prefix": prefix,
+                "line_mode": line_mode,
+                "decoder": codecs.getincrementaldecoder("utf-8")(errors="replace"),
+                "partial": "",
+            }
+        return streams
+        
+    def _read_stream(self, fd, stream):
+        """Read what is available on a non-blocking fd and log it.
+        
+        Returns False once the stream has reached EOF.
+        """
+        try:
+            data = os.read(fd, 65536)
+        except BlockingIOError:
+            return True
+            
+        text = stream["decoder"].decode(data, final=not data)
+        if stream["line_mode"]:
+            # stderr is line oriented, keep the trailing partial line for later
+            *lines, stream["partial"] = (stream["partial"] + text).split("\n")
+            if not data and stream["partial"]:
+                lines.append(stream["partial"])
+                stream["partial"] = ""
+            for line in lines:
+                if line.strip():
+                    self.log_message(f"{stream['prefix']}: {line.strip()}")
+        elif self.output_queue is not None:
+            # Transcriptions are space separated by default, so forward as they arrive
+            if text:
+                self._queue_output(text)
+            if not data:
+                self._finish_output()
+        elif text.strip():
+            self.log_message(f"{stream['prefix']}: {text.strip()}")
+            
+        return bool(data)
+        
     def monitor_processes(self):
         """Monitor the running processes."""
+        streams = self._open_monitor_streams() if self.scribe_process else {}
+        
         while self.is_running:
             # Monitor scribe process
             if self.scribe_process and not self.scribe_process_logged:
                 try:
+                    # Multiplex stdout/stderr in one wait instead of polling
+                    if streams:
+                        readable, _, _ = select.select(list(streams), [], [], 0.25)
+                        for fd in readable:
+                            if not self._read_stream(fd, streams[fd]):
+                                del streams[fd]
+                    else:
+                        time.sleep(0.25)
+                        
                     if self.scribe_process.poll() is not None:
-                        # Process has terminated
-                        return_code = self.scribe_process.returncode
-                        if return_code != 0:
-                            # Read stderr for error messages
-                            stderr_output = self.scribe_process.stderr.read()
-                            if stderr_output:
-                                self.log_message(f"Scribe error: {stderr_output}")
+                        # Process has terminated, drain whatever is left in the pipes
+                        for fd, stream in streams.items():
+                            try:
+                                while self._read_stream(fd, stream):
+                                    pass
+                            except OSError:
+                                pass
+                        streams.clear()
                         
+                        return_code = self.scribe_process.returncode
                         self.log_message(f"Scribe process ended with return code: {return_code}")
                         self.scribe_process_logged = True
                         self.scribe_process = None
                         break
                         
-                    # Read stderr from scribe process for log messages
-                    if self.scribe_process.stderr:
-                        try:
-                            # Non-blocking read
-                            import select
-                            if select.select([self.scribe_process.stderr], [], [], 0.1)[0]:
-                                line = self.scribe_process.stderr.readline()
-                                if line:
-                                    self.log_message(f"Scribe: {line.strip()}")
-                        except Exception as e:
-                            self.log_message(f"Error reading scribe stderr: {e}")
-                            
                 except Exception as e:
                     self.log_message(f"Error monitoring scribe process: {e}")
                     self.scribe_process_logged = True
                     self.scribe_process = None
                     break
+            else:
+                time.sleep(0.25)
                     
             # Monitor output process
             if self.output_process and not self.output_process_logged:
@@ -412,10 +561,9 @@ class ScribeGUI:
                     self.log_message(f"Error monitoring output process: {e}")
                     self.output_process_logged = True
                     self.output_process = None
-                
-            time.sleep(0.1)  # Sleep for 100ms
             
         # Process ended, cleanup
+        self._finish_output()
         self.cleanup_processes()
         
     def show_error_dialog(self, title, message):
@@ -437,7 +585,19 @@ class ScribeGUI:
     def on_window_destroy(self, widget):
         """Handle window closing."""
         if self.is_running:
+            processes = (self.scribe_process, self.output_process)
             self.on_stop_clicked(None)
+            
+            # The escalation timers never fire once the main loop quits
+            for process in processes:
+                if process:
+                    try:
+                        process.wait(timeout=STOP_TERM_AFTER_SECONDS)
+                    except subprocess.TimeoutExpired:
+                        self._signal_group(process, signal.SIGKILL)
+                        
+            # Let the monitor thread exit so the interpreter can
+            self.is_running = False
         Gtk.main_quit()
         
     def run(self):
@@ -0,0 +1,51 @@
+"""Helpers shared by the standalone and daemon GUIs."""
+
+# The log is trimmed in chunks once it crosses a high-water mark so the cost
+# of inserting stays proportional to what is kept, not the whole session
+LOG_MAX_LINES = 6000
+LOG_KEEP_LINES = 5000
+
+# Accepted range for the silence threshold entry
+MIN_SILENCE_THRESHOLD = 0.0001
+MAX_SILENCE_THRESHOLD = 1.0
+
+
+def trim_log_buffer(buffer):
+    """Delete the oldest lines of a log buffer once it has grown past LOG_MAX_LINES."""
+    line_count = buffer.get_line_count()
+    if line_count > LOG_MAX_LINES:
+        buffer.delete(
+            buffer.get_start_iter(),
+            buffer.get_iter_at_line(line_count - LOG_KEEP_LINES)
+        )
+
+
+def validate_threshold_entry(entry):
+    """Validate the silence threshold entry and flag it when invalid.
+    
+    Returns (threshold, error); threshold is None when the entry is empty or
+    invalid, so the default is used.
+    """
+    text = entry.get_text().strip()
+    threshold = None
+    error = None
+    if text:
+        try:
+            value = float(text)
+        except ValueError:
+            error = f"'{text}' is not a number"
+        else:
+            if MIN_SILENCE_THRESHOLD <= value <= MAX_SILENCE_THRESHOLD:
+                threshold = value
+            else:
+                error = (f"{value} is outside the recommended range "
+                         f"({MIN_SILENCE_THRESHOLD}-{MAX_SILENCE_THRESHOLD})")
+    
+    style = entry.get_style_context()
+    if error:
+        style.add_class("error")
+        entry.set_tooltip_text(f"{error}, the default will be used")
+    else:
+        style.remove_class("error")
+        entry.set_tooltip_text(None)
+    return threshold, error
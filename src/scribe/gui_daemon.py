@@ -11,9 +11,20 @@ import time
 try:
     from .daemon_manager import DaemonManager
     from .ipc import ScribeStreamingClient
+    from .gui_common import trim_log_buffer, validate_threshold_entry
 except ImportError:
     from scribe.daemon_manager import DaemonManager
     from scribe.ipc import ScribeStreamingClient
+    from scribe.gui_common import trim_log_buffer, validate_threshold_entry
+
+
+# Delay used to coalesce incoming transcriptions into a single redraw
+TRANSCRIPTION_FLUSH_MS = 40
+
+# Text buffers are trimmed in chunks once they cross a high-water mark so the
+# cost of inserting stays proportional to what is kept, not the whole session
+TRANSCRIPTION_MAX_CHARS = 300000
+TRANSCRIPTION_KEEP_CHARS = 250000
 
 
 class ScribeDaemonGUI:
@@ -28,6 +39,11 @@ class ScribeDaemonGUI:
         # Process logging flags to prevent repetitive messages
         self.last_status_update = 0
         
+        # Transcriptions waiting for the next batched buffer update
+        self.pending_transcription = []
+        self.transcription_lock = threading.Lock()
+        self.transcription_flush_scheduled = False
+        
         # Build the GUI
         self.build_ui()
         
@@ -136,6 +152,8 @@ class ScribeDaemonGUI:
         self.threshold_entry.set_text("0.002")
         self.threshold_entry.set_max_width_chars(10)
         self.threshold_entry.set_placeholder_text("0.002")
+        self.threshold_entry.connect("changed", self.on_threshold_changed)
+        self.on_threshold_changed(self.threshold_entry)
         threshold_box.pack_start(self.threshold_entry, False, False, 0)
         
         # Add helper text
@@ -190,6 +208,11 @@ class ScribeDaemonGUI:
         self.transcription_textview.set_cursor_visible(False)
         self.transcription_textview.set_wrap_mode(Gtk.WrapMode.WORD)
         self.transcription_buffer = self.transcription_textview.get_buffer()
+        # Bound once, _flush_transcription runs for every batch of text
+        self._transcription_end_iter = self.transcription_buffer.get_end_iter
+        self._transcription_insert = self.transcription_buffer.insert
+        self._transcription_scroll = self.transcription_textview.scroll_mark_onscreen
+        self._transcription_mark = self.transcription_buffer.get_insert()
         transcription_scrolled.add(self.transcription_textview)
         transcription_box.pack_start(transcription_scrolled, True, True, 0)
         
@@ -217,6 +240,11 @@ class ScribeDaemonGUI:
         self.log_textview.set_editable(False)
         self.log_textview.set_cursor_visible(False)
         self.log_buffer = self.log_textview.get_buffer()
+        # Bound once, log_message runs for every line of output
+        self._log_end_iter = self.log_buffer.get_end_iter
+        self._log_insert = self.log_buffer.insert
+        self._log_scroll = self.log_textview.scroll_mark_onscreen
+        self._log_mark = self.log_buffer.get_insert()
         log_scrolled.add(self.log_textview)
         log_box.pack_start(log_scrolled, True, True, 0)
         
@@ -231,26 +259,54 @@ class ScribeDaemonGUI:
     def log_message(self, message):
         """Add a message to the log output."""
         def update_log():
-            end_iter = self.log_buffer.get_end_iter()
-            self.log_buffer.insert(end_iter, f"{message}\n")
+            self._log_insert(self._log_end_iter(), f"{message}\n")
+            
+            trim_log_buffer(self.log_buffer)
             
             # Auto-scroll to bottom
-            mark = self.log_buffer.get_insert()
-            self.log_textview.scroll_mark_onscreen(mark)
+            self._log_scroll(self._log_mark)
             
         GLib.idle_add(update_log)
         
     def add_transcription(self, text):
-        """Add transcription text to the transcription output."""
-        def update_transcription():
-            end_iter = self.transcription_buffer.get_end_iter()
-            self.transcription_buffer.insert(end_iter, f"{text} ")
+        """Add transcription text to the transcription output.
+        
+        Text arriving within TRANSCRIPTION_FLUSH_MS is inserted in one update
+        so a fast speaker does not cause a redraw per segment.
+        """
+        with self.transcription_lock:
+            self.pending_transcription.append(f"{text} ")
+            if self.transcription_flush_scheduled:
+                return
+            self.transcription_flush_scheduled = True
             
-            # Auto-scroll to bottom
-            mark = self.transcription_buffer.get_insert()
-            self.transcription_textview.scroll_mark_onscreen(mark)
+        GLib.timeout_add(TRANSCRIPTION_FLUSH_MS, self._flush_transcription)
+        
+    def _flush_transcription(self):
+        """Insert all pending transcription text into the buffer."""
+        with self.transcription_lock:
+            text = "".join(self.pending_transcription)
+            self.pending_transcription.clear()
+            self.transcription_flush_scheduled = False
             
-        GLib.idle_add(update_transcription)
+        self._transcription_insert(self._transcription_end_iter(), text)
+        
+        # Transcriptions are a single wrapped line, so trim by characters
+        char_count = self.transcription_buffer.get_char_count()
+        if char_count > TRANSCRIPTION_MAX_CHARS:
+            self.transcription_buffer.delete(
+                self.transcription_buffer.get_start_iter(),
+                self.transcription_buffer.get_iter_at_offset(char_count - TRANSCRIPTION_KEEP_CHARS)
+            )
+        
+        # Auto-scroll to bottom
+        self._transcription_scroll(self._transcription_mark)
+        
+        return False  # One-shot timeout
+        
+    def on_threshold_changed(self, entry):
+        """Validate the silence threshold as it is typed, not when starting."""
+        self.silence_threshold, self.threshold_error = validate_threshold_entry(entry)
         
     def on_clear_log_clicked(self, button):
         """Clear the log output."""
@@ -376,17 +432,12 @@ class ScribeDaemonGUI:
         model = self.model_combo.get_active_text()
         language = self.language_entry.get_text().strip() or None
         
-        threshold_text = self.threshold_entry.get_text().strip()
+        # Already validated by on_threshold_changed
         silence_threshold = 0.002
-        if threshold_text:
-            try:
-                threshold_value = float(threshold_text)
-                if 0.0001 <= threshold_value <= 1.0:
-                    silence_threshold = threshold_value
-                else:
-                    self.log_message(f"Warning: Silence threshold {threshold_value} outside range, using default")
-            except ValueError:
-                self.log_message(f"Warning: Invalid silence threshold '{threshold_text}', using default")
+        if self.silence_threshold is not None:
+            silence_threshold = self.silence_threshold
+        elif self.threshold_error:
+            self.log_message(f"Warning: Silence threshold {self.threshold_error}, using default")
         
         config = {
             "model": model,
@@ -1,18 +1,45 @@
 """IPC protocol implementation for scribe daemon communication."""
 
 import json
+import queue
+import select
+import selectors
 import socket
+import struct
 import threading
 import time
 import os
 import sys
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional, Callable
+from typing import Dict, Any, List, Optional, Callable
+
+# Use orjson for the message hot path when available; it works on bytes
+# directly and is several times faster than the standard library
+try:
+    import orjson
+    
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    # orjson not available, fall back to json with identical wire format
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+    
+    _loads = json.loads
 
 
 class ScribeIPCProtocol:
-    """Handles IPC communication between daemon and clients."""
+    """Handles IPC communication between daemon and clients.
+    
+    Messages on the socket are framed as a 4-byte big-endian payload length
+    followed by the UTF-8 JSON payload, so a message can span several reads
+    and several messages can arrive in one read.
+    """
+    
+    HEADER = struct.Struct(">I")
+    MAX_MESSAGE_SIZE = 16 * 1024 * 1024
     
     def __init__(self, socket_path: Optional[str] = None):
         if socket_path is None:
@@ -42,18 +69,133 @@ class ScribeIPCProtocol:
         except OSError as e:
             # Other OS errors
             print(f"Warning: Error removing socket {self.socket_path}: {e}", file=sys.stderr)
+            
+    @classmethod
+    def encode_message(cls, message: Dict[str, Any]) -> bytes:
+        """Serialize a message into a length-prefixed frame."""
+        body = _dumps(message)
+        return cls.HEADER.pack(len(body)) + body
+    
+    @classmethod
+    def send_message(cls, sock: socket.socket, message: Dict[str, Any]):
+        """Send a complete framed message."""
+        sock.sendall(cls.encode_message(message))
+        
+    @staticmethod
+    def decode_message(body: bytes) -> Dict[str, Any]:
+        """Deserialize a frame payload.
+        
+        Raises json.JSONDecodeError (orjson's error subclasses it) on bad input.
+        """
+        return _loads(body)
+    
+    @classmethod
+    def split_frames(cls, buffer: bytearray) -> List[bytes]:
+        """Remove and return the payloads of all complete frames in buffer.
+        
+        Any trailing partial frame is left in buffer for the next read.
+        Raises ValueError if a frame announces more than MAX_MESSAGE_SIZE.
+        """
+        payloads = []
+        offset = 0
+        while len(buffer) - offset >= cls.HEADER.size:
+            (length,) = cls.HEADER.unpack_from(buffer, offset)
+            if length > cls.MAX_MESSAGE_SIZE:
+                raise ValueError(f"Message of {length} bytes exceeds limit")
+            end = offset + cls.HEADER.size + length
+            if len(buffer) < end:
+                break
+            payloads.append(bytes(buffer[offset + cls.HEADER.size:end]))
+            offset = end
+        del buffer[:offset]
+        return payloads
+    
+    @staticmethod
+    def recv_exactly(sock: socket.socket, size: int) -> Optional[bytes]:
+        """Read exactly size bytes, or return None if the peer closed first."""
+        buffer = bytearray(size)
+        view = memoryview(buffer)
+        received = 0
+        while received < size:
+            count = sock.recv_into(view[received:])
+            if not count:
+                return None
+            received += count
+        return bytes(buffer)
+    
+    @classmethod
+    def recv_message(cls, sock: socket.socket) -> Optional[Dict[str, Any]]:
+        """Receive one framed message, or return None if the connection closed.
+        
+        Raises json.JSONDecodeError if the payload is not valid JSON and
+        ValueError if the announced length exceeds MAX_MESSAGE_SIZE.
+        """
+        header = cls.recv_exactly(sock, cls.HEADER.size)
+        if header is None:
+            return None
+            
+        (length,) = cls.HEADER.unpack(header)
+        if length > cls.MAX_MESSAGE_SIZE:
+            raise ValueError(f"Message of {length} bytes exceeds limit")
+            
+        body = cls.recv_exactly(sock, length)
+        if body is None:
+            return None
+            
+        return cls.decode_message(body)
+
+
+# Report a vanished peer as EPIPE rather than raising SIGPIPE (Linux)
+_SEND_FLAGS = getattr(socket, "MSG_NOSIGNAL", 0)
+
+
+class _ClientConnection:
+    """Per-client state for the IPC server's selector loop."""
+    
+    def __init__(self, sock: socket.socket):
+        self.sock = sock
+        self.buffer = bytearray()
+        # Responses and broadcasts are sent from different threads
+        self.send_lock = threading.Lock()
+        
+    def send(self, data: bytes):
+        """Send a complete frame without interleaving with other senders."""
+        with self.send_lock:
+            self.sock.sendall(data, _SEND_FLAGS)
+            
+    def disconnect(self):
+        """Shut the connection down from any thread.
+        
+        The selector loop sees the resulting EOF and releases the socket, so
+        only that thread ever unregisters or closes client sockets.
+        """
+        try:
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            # Already disconnected
+            pass
 
 
 class ScribeIPCServer:
-    """IPC server for daemon process."""
+    """IPC server for daemon process.
+    
+    A single selector thread accepts connections and reads from every client;
+    complete messages are handed to a small worker pool so one slow handler
+    does not hold up the other clients.
+    """
+    
+    MAX_WORKERS = 8
     
     def __init__(self, socket_path: Optional[str] = None):
         self.protocol = ScribeIPCProtocol(socket_path)
         self.socket = None
         self.running = False
-        self.clients = []
+        self.clients = set()
+        self.clients_lock = threading.Lock()
         self.handlers = {}
         self.server_thread = None
+        self.selector = None
+        self.pool = None
         
     def register_handler(self, command: str, handler: Callable[[Dict[str, Any]], Dict[str, Any]]):
         """Register a command handler."""
@@ -68,15 +210,21 @@ class ScribeIPCServer:
         self.protocol.cleanup_socket()
         
         self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-        self.socket.bind(str(self.protocol.socket_path))
         
-        # Set secure permissions on socket file (0600 - owner read/write only)
+        # Create the socket file owner-only from the start; a chmod after bind
+        # leaves a window where other users can connect
+        old_umask = os.umask(0o077)
         try:
-            os.chmod(self.protocol.socket_path, 0o600)
-        except OSError as e:
-            print(f"Warning: Could not set secure permissions on socket: {e}", file=sys.stderr)
+            self.socket.bind(str(self.protocol.socket_path))
+        finally:
+            os.umask(old_umask)
         
         self.socket.listen(5)
+        self.socket.setblocking(False)
+        
+        self.selector = selectors.DefaultSelector()
+        self.selector.register(self.socket, selectors.EVENT_READ)
+        self.pool = ThreadPoolExecutor(max_workers=self.MAX_WORKERS, thread_name_prefix="scribe-ipc")
         
         self.running = True
         self.server_thread = threading.Thread(target=self._server_loop, daemon=True)
@@ -89,14 +237,20 @@ class ScribeIPCServer:
             
         self.running = False
         
+        # Wait for the selector loop to notice and exit
+        if self.server_thread and self.server_thread.is_alive():
+            self.server_thread.join(timeout=2)
+            
         # Close all client connections
-        for client in self.clients[:]:
+        with self.clients_lock:
+            clients = list(self.clients)
+            self.clients.clear()
+        for client in clients:
             try:
-                client.close()
+                client.sock.close()
             except (OSError, socket.error):
                 # Socket already closed or error closing
                 pass
-        self.clients.clear()
         
         # Close server socket
         if self.socket:
@@ -105,75 +259,140 @@ class ScribeIPCServer:
             except (OSError, socket.error):
                 # Socket already closed or error closing
                 pass
+                
+        if self.selector:
+            self.selector.close()
+            
+        if self.pool:
+            self.pool.shutdown(wait=False, cancel_futures=True)
             
         # Clean up socket file
         self.protocol.cleanup_socket()
-        
-        # Wait for server thread to finish
-        if self.server_thread and self.server_thread.is_alive():
-            self.server_thread.join(timeout=2)
             
     def _server_loop(self):
-        """Main server loop to accept connections."""
+        """Main server loop to accept connections and read client messages."""
         while self.running:
             try:
-                client_socket, address = self.socket.accept()
-                self.clients.append(client_socket)
-                
-                # Handle client in separate thread
-                client_thread = threading.Thread(
-                    target=self._handle_client,
-                    args=(client_socket,),
-                    daemon=True
-                )
-                client_thread.start()
-                
-            except OSError:
-                # Socket closed, exit loop
+                events = self.selector.select(timeout=0.5)
+            except (OSError, ValueError):
+                # Selector closed, exit loop
                 break
-            except Exception as e:
-                print(f"Server error: {e}")
                 
-    def _handle_client(self, client_socket):
-        """Handle a client connection."""
-        try:
-            while self.running:
-                # Receive message
-                data = client_socket.recv(4096)
-                if not data:
-                    break
+            for key, _ in events:
+                try:
+                    if key.data is None:
+                        self._accept_client()
+                    else:
+                        self._read_client(key.data)
+                except Exception as e:
+                    print(f"Server error: {e}")
                     
+    def _accept_client(self):
+        """Accept a pending connection and start watching it."""
+        try:
+            client_socket, address = self.socket.accept()
+        except BlockingIOError:
+            return
+            
+        if not self._is_trusted_peer(client_socket):
+            client_socket.close()
+            return
+            
+        # Client sockets stay blocking: reads only happen once the selector
+        # reports data, and sendall must not fail on a full buffer
+        client_socket.setblocking(True)
+        connection = _ClientConnection(client_socket)
+        with self.clients_lock:
+            self.clients.add(connection)
+        self.selector.register(client_socket, selectors.EVENT_READ, connection)
+        
+    def _is_trusted_peer(self, client_socket: socket.socket) -> bool:
+        """Check that the connecting process runs as the daemon's user.
+        
+        Uses SO_PEERCRED where the platform provides it (Linux); elsewhere the
+        owner-only socket file permissions are the only check.
+        """
+        if not hasattr(socket, "SO_PEERCRED"):
+            return True
+            
+        try:
+            creds = client_socket.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+        except OSError as e:
+            print(f"Warning: Could not read peer credentials: {e}", file=sys.stderr)
+            return False
+            
+        pid, uid, gid = struct.unpack("3i", creds)
+        if uid != os.getuid():
+            print(f"Warning: Rejected connection from uid {uid} (pid {pid})", file=sys.stderr)
+            return False
+        return True
+        
+    def _read_client(self, connection: _ClientConnection):
+        """Read available data from a client and dispatch complete messages."""
+        try:
+            data = connection.sock.recv(65536)
+        except OSError:
+            data = b""
+            
+        if not data:
+            self._remove_client(connection)
+            return
+            
+        connection.buffer += data
+        try:
+            payloads = ScribeIPCProtocol.split_frames(connection.buffer)
+        except ValueError as e:
+            print(f"Client handler error: {e}")
+            self._remove_client(connection)
+            return
+            
+        for payload in payloads:
+            self.pool.submit(self._handle_message, connection, payload)
+            
+    def _remove_client(self, connection: _ClientConnection):
+        """Stop watching a client and close its socket (selector thread only)."""
+        try:
+            self.selector.unregister(connection.sock)
+        except (KeyError, ValueError):
+            pass
+        try:
+            connection.sock.close()
+        except OSError:
+            pass
+        with self.clients_lock:
+            self.clients.discard(connection)
+            
+    def _handle_message(self, connection: _ClientConnection, payload: bytes):
+        """Process one message on a worker thread and send the response."""
+        try:
+            message = ScribeIPCProtocol.decode_message(payload)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            # The frame was consumed whole, so the stream is still in sync
+            response = {
+                "status": "error",
+                "message": "Invalid JSON"
+            }
+        else:
+            if not isinstance(message, dict):
+                response = {
+                    "status": "error",
+                    "message": "Invalid message"
+                }
+            else:
+                # Every consumed frame gets exactly one reply, even on failure
                 try:
-                    message = json.loads(data.decode('utf-8'))
                     response = self._process_message(message)
-                    
-                    # Send response
-                    response_data = json.dumps(response).encode('utf-8')
-                    client_socket.send(response_data)
-                    
-                except json.JSONDecodeError:
-                    error_response = {
-                        "status": "error",
-                        "message": "Invalid JSON"
-                    }
-                    client_socket.send(json.dumps(error_response).encode('utf-8'))
-                    
                 except Exception as e:
-                    error_response = {
+                    response = {
                         "status": "error",
                         "message": str(e)
                     }
-                    client_socket.send(json.dumps(error_response).encode('utf-8'))
-                    
+
+        try:
+            connection.send(ScribeIPCProtocol.encode_message(response))
         except Exception as e:
             print(f"Client handler error: {e}")
-        finally:
-            try:
-                client_socket.close()
-            except:
-                pass
-            if client_socket in self.clients:
-                self.clients.remove(client_socket)
+            connection.disconnect()
                 
     def _process_message(self, message: Dict[str, Any]) -> Dict[str, Any]:
         """Process a message from client."""
@@ -192,53 +411,87 @@ class ScribeIPCServer:
     
     def broadcast_message(self, message: Dict[str, Any]):
         """Send a message to all connected clients."""
-        message_data = json.dumps(message).encode('utf-8')
+        self._broadcast_data(ScribeIPCProtocol.encode_message(message))
         
-        for client in self.clients[:]:  # Copy list to avoid modification during iteration
+    def broadcast_messages(self, messages: List[Dict[str, Any]]):
+        """Send several messages to all connected clients in one write each."""
+        if messages:
+            self._broadcast_data(b"".join(ScribeIPCProtocol.encode_message(m) for m in messages))
+            
+    def _broadcast_data(self, message_data: bytes):
+        """Send already framed bytes to all connected clients."""
+        # Snapshot under the lock, send without holding it
+        with self.clients_lock:
+            clients = list(self.clients)
+            
+        dead = []
+        for client in clients:
             try:
                 client.send(message_data)
-            except:
-                # Client disconnected, remove it
-                try:
-                    client.close()
-                except:
-                    pass
-                if client in self.clients:
-                    self.clients.remove(client)
+            except OSError:
+                dead.append(client)
+                
+        if dead:
+            # Stop broadcasting to them now; the selector loop closes them
+            with self.clients_lock:
+                self.clients.difference_update(dead)
+            for client in dead:
+                client.disconnect()
 
 
 class ScribeIPCClient:
     """IPC client for communicating with daemon."""
     
+    # Seconds between checks for the daemon socket while connecting
+    CONNECT_POLL_INTERVAL = 0.01
+    
     def __init__(self, socket_path: Optional[str] = None):
         self.protocol = ScribeIPCProtocol(socket_path)
         self.socket = None
         self.connected = False
         
+        # Optional background reader, see start_reader()
+        self.reader_thread = None
+        self.responses = None
+        self.messages = None
+        
     def connect(self, timeout: float = 5.0) -> bool:
         """Connect to daemon."""
         if self.connected:
             return True
             
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            try:
-                self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-                self.socket.connect(str(self.protocol.socket_path))
-                self.connected = True
-                return True
-            except (FileNotFoundError, ConnectionRefusedError):
-                # Daemon not running, wait and retry
-                time.sleep(0.1)
-            except Exception as e:
-                print(f"Connection error: {e}")
+        socket_path = str(self.protocol.socket_path)
+        deadline = time.monotonic() + timeout
+        while True:
+            # Only pay for a socket once the daemon has created its path
+            if os.path.exists(socket_path):
+                sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                try:
+                    sock.connect(socket_path)
+                    self.socket = sock
+                    self.connected = True
+                    return True
+                except (FileNotFoundError, ConnectionRefusedError):
+                    # Stale socket or daemon not listening yet
+                    sock.close()
+                except Exception as e:
+                    sock.close()
+                    print(f"Connection error: {e}")
+                    return False
+                    
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
                 return False
-                
-        return False
+            time.sleep(min(self.CONNECT_POLL_INTERVAL, remaining))
         
     def disconnect(self):
         """Disconnect from daemon."""
         if self.socket:
+            try:
+                # Unblocks a reader thread sitting in recv
+                self.socket.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
             try:
                 self.socket.close()
             except:
@@ -246,6 +499,56 @@ class ScribeIPCClient:
             self.socket = None
         self.connected = False
         
+        if self.reader_thread and self.reader_thread.is_alive():
+            self.reader_thread.join(timeout=1)
+        self.reader_thread = None
+        
+    def start_reader(self):
+        """Read incoming messages on a background thread with blocking reads.
+        
+        Responses to send_command and pushed messages (those carrying a
+        "type") are routed to separate queues, so the reader can own the
+        socket while commands are still sent over it.
+        """
+        if not self.connected or self.reader_thread:
+            return
+            
+        self.responses = queue.Queue()
+        self.messages = queue.Queue()
+        self.reader_thread = threading.Thread(target=self._reader_loop, daemon=True)
+        self.reader_thread.start()
+        
+    def interrupt_receive(self):
+        """Wake a receive_message call blocked on the reader queue."""
+        if self.reader_thread:
+            self.messages.put(None)
+            
+    def _reader_loop(self):
+        """Route framed messages from the daemon until the connection closes."""
+        try:
+            while True:
+                try:
+                    message = ScribeIPCProtocol.recv_message(self.socket)
+                except json.JSONDecodeError:
+                    # The frame was consumed whole, so the stream is still in sync
+                    self.messages.put({"status": "error", "message": "Invalid message from daemon"})
+                    continue
+                    
+                if message is None:
+                    break
+                    
+                if "type" in message:
+                    self.messages.put(message)
+                else:
+                    self.responses.put(message)
+        except (OSError, ValueError, AttributeError):
+            # Socket shut down or closed by disconnect()
+            pass
+        finally:
+            self.connected = False
+            self.responses.put(None)
+            self.messages.put(None)
+        
     def send_command(self, command: str, **kwargs) -> Dict[str, Any]:
         """Send a command to daemon and return response."""
         if not self.connected:
@@ -255,15 +558,16 @@ class ScribeIPCClient:
         
         try:
             # Send message
-            message_data = json.dumps(message).encode('utf-8')
-            self.socket.send(message_data)
+            ScribeIPCProtocol.send_message(self.socket, message)
             
             # Receive response
-            response_data = self.socket.recv(4096)
-            if not response_data:
+            if self.reader_thread:
+                response = self.responses.get()
+            else:
+                response = ScribeIPCProtocol.recv_message(self.socket)
+            if response is None:
                 return {"status": "error", "message": "Connection closed"}
                 
-            response = json.loads(response_data.decode('utf-8'))
             return response
             
         except json.JSONDecodeError:
@@ -271,28 +575,34 @@ class ScribeIPCClient:
         except Exception as e:
             return {"status": "error", "message": f"Communication error: {e}"}
     
-    def receive_message(self, timeout: float = 1.0) -> Optional[Dict[str, Any]]:
-        """Receive a message from daemon (non-blocking)."""
+    def receive_message(self, timeout: Optional[float] = 1.0) -> Optional[Dict[str, Any]]:
+        """Receive a message from daemon.
+        
+        Waits up to timeout seconds, or indefinitely when timeout is None.
+        Returns None on timeout or when the connection has closed.
+        """
+        if self.reader_thread:
+            try:
+                return self.messages.get(timeout=timeout)
+            except queue.Empty:
+                return None
+                
         if not self.connected:
             return None
             
         try:
-            self.socket.settimeout(timeout)
-            data = self.socket.recv(4096)
-            if not data:
+            # Only wait for the start of a frame; once it arrives the whole
+            # frame is read so a timeout can never split a message
+            readable, _, _ = select.select([self.socket], [], [], timeout)
+            if not readable:
                 return None
                 
-            message = json.loads(data.decode('utf-8'))
-            return message
+            return ScribeIPCProtocol.recv_message(self.socket)
             
-        except socket.timeout:
-            return None
         except json.JSONDecodeError:
             return {"status": "error", "message": "Invalid message from daemon"}
         except Exception as e:
             return {"status": "error", "message": f"Receive error: {e}"}
-        finally:
-            self.socket.settimeout(None)
             
     def is_daemon_running(self) -> bool:
         """Check if daemon is running."""
@@ -327,6 +637,9 @@ class ScribeStreamingClient:
         self.on_transcription = on_transcription
         self.on_error = on_error
         
+        # Messages are read by a blocking reader thread from here on
+        self.client.start_reader()
+        
         # Send start command
         response = self.client.send_command("start_recording")
         if response.get("status") != "success":
@@ -348,6 +661,10 @@ class ScribeStreamingClient:
         # Send stop command
         self.client.send_command("stop_recording")
         
+        # The stream loop blocks on the reader; wake it in case no
+        # recording_stopped message is coming
+        self.client.interrupt_receive()
+        
         # Wait for stream thread to finish
         if self.stream_thread and self.stream_thread.is_alive():
             self.stream_thread.join(timeout=2)
@@ -355,8 +672,11 @@ class ScribeStreamingClient:
     def _stream_loop(self):
         """Stream transcription messages."""
         while self.streaming:
-            message = self.client.receive_message(timeout=0.1)
+            message = self.client.receive_message(timeout=None)
             if message is None:
+                if not self.streaming or not self.client.connected:
+                    break
+                # Wake-up left over from an earlier session
                 continue
                 
             if message.get("type") == "transcription":
@@ -9,8 +9,10 @@ import platform
 import time
 import threading
 import queue
-import wave
+import math
+import collections
 import numpy as np
+from concurrent import futures
 from pathlib import Path
 
 import click
@@ -32,12 +34,41 @@ def setup_cudnn_path():
         # nvidia.cudnn not available, skip
         pass
 
-# Set up cuDNN path before importing faster_whisper
-if "SCRIBE_CUDNN_SETUP" not in os.environ:
-    os.environ["SCRIBE_CUDNN_SETUP"] = "1"
-    setup_cudnn_path()
+# Handle both module and script execution
+try:
+    from .audio import (
+        _load_whisper, webrtcvad, WEBRTC_VAD_AGGRESSIVENESS,
+        ADAPTIVE_THRESHOLD_RATIO, ADAPTIVE_THRESHOLD_SECONDS,
+        SILERO_SPEECH_THRESHOLD, SILERO_MIN_SPEECH_MS, vad_filter_options,
+        njit, _vad_scan, _frame_energies, VAD_SCAN_SILENCE, VAD_SCAN_MAX_DURATION,
+        AUDIO_QUEUE_SECONDS, TRANSCRIBE_WORKERS, DEVICE_CHOICES, COMPUTE_TYPE_CHOICES,
+        resolve_device, FFMPEG_POPEN_KWARGS, ffmpeg_audio_input_args,
+    )
+except ImportError:
+    from scribe.audio import (
+        _load_whisper, webrtcvad, WEBRTC_VAD_AGGRESSIVENESS,
+        ADAPTIVE_THRESHOLD_RATIO, ADAPTIVE_THRESHOLD_SECONDS,
+        SILERO_SPEECH_THRESHOLD, SILERO_MIN_SPEECH_MS, vad_filter_options,
+        njit, _vad_scan, _frame_energies, VAD_SCAN_SILENCE, VAD_SCAN_MAX_DURATION,
+        AUDIO_QUEUE_SECONDS, TRANSCRIBE_WORKERS, DEVICE_CHOICES, COMPUTE_TYPE_CHOICES,
+        resolve_device, FFMPEG_POPEN_KWARGS, ffmpeg_audio_input_args,
+    )
 
-from faster_whisper import WhisperModel
+
+def setup_cudnn_once():
+    """Run setup_cudnn_path() once per process tree.
+    
+    It may re-exec the process, so main() calls this before printing
+    anything; the environment flag stops the re-exec'd process repeating it.
+    """
+    if "SCRIBE_CUDNN_SETUP" not in os.environ:
+        os.environ["SCRIBE_CUDNN_SETUP"] = "1"
+        setup_cudnn_path()
+
+
+# Batch recordings are written and read back once; keep them on tmpfs when the
+# system has one so they never touch the disk
+RECORDING_TEMP_DIR = "/dev/shm" if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK) else None
 
 
 class FFmpegRecorder:
@@ -52,27 +83,12 @@ class FFmpegRecorder:
         
     def get_audio_input_args(self):
         """Get platform-specific FFmpeg audio input arguments."""
-        if self.platform == "linux":
-            # Try ALSA first, then PulseAudio
-            try:
-                # Test if ALSA is available
-                subprocess.run(["arecord", "-l"], capture_output=True, check=True)
-                return ["-f", "alsa", "-i", "default"]
-            except:
-                # Fallback to PulseAudio
-                return ["-f", "pulse", "-i", "default"]
-        elif self.platform == "darwin":  # macOS
-            return ["-f", "avfoundation", "-i", ":0"]
-        elif self.platform == "windows":
-            return ["-f", "dshow", "-i", "audio="]
-        else:
-            # Fallback - might work on some systems
-            return ["-f", "pulse", "-i", "default"]
+        return list(ffmpeg_audio_input_args(self.platform))
     
     def start_recording(self):
         """Start recording audio from microphone using FFmpeg."""
         # Create temporary file for recording
-        self.temp_file = tempfile.NamedTemporaryFile(suffix='.wav', delete=False)
+        self.temp_file = tempfile.NamedTemporaryFile(suffix='.pcm', delete=False, dir=RECORDING_TEMP_DIR)
         temp_filename = self.temp_file.name
         self.temp_file.close()
         
@@ -80,6 +96,7 @@ class FFmpegRecorder:
         cmd = ["ffmpeg", "-y"]  # -y to overwrite output files
         cmd.extend(self.get_audio_input_args())
         cmd.extend([
+            "-f", "s16le",  # Raw PCM, read back without decoding
             "-acodec", "pcm_s16le",  # 16-bit PCM
             "-ar", str(self.sample_rate),  # Sample rate
             "-ac", str(self.channels),  # Channels (mono)
@@ -92,7 +109,8 @@ class FFmpegRecorder:
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                stdin=subprocess.PIPE
+                stdin=subprocess.PIPE,
+                **FFMPEG_POPEN_KWARGS
             )
             return temp_filename
         except FileNotFoundError:
@@ -121,6 +139,15 @@ class FFmpegRecorder:
         
         return self.temp_file.name if self.temp_file else None
     
+    def read_recording(self, filename):
+        """Load a finished recording as the float32 array faster-whisper accepts.
+        
+        The file is raw PCM, so faster-whisper does not have to decode and
+        resample it again.
+        """
+        audio_data = np.fromfile(filename, dtype=np.int16)
+        return np.multiply(audio_data, np.float32(1.0 / 32768.0), dtype=np.float32)
+    
     def cleanup(self):
         """Clean up resources and temporary files."""
         if self.process:
@@ -137,17 +164,96 @@ class FFmpegRecorder:
                 pass
 
 
+class TranscriptionPipeline:
+    """Transcribes streaming chunks on worker threads while recording continues.
+    
+    Text is passed to output_text in the order chunks were submitted, as soon
+    as a chunk and every chunk before it have been transcribed.
+    """
+    
+    def __init__(self, whisper_model, output_text, language=None, debug=False,
+                 verbose=False, max_workers=TRANSCRIBE_WORKERS, transcribe_options=None):
+        self.whisper_model = whisper_model
+        self.output_text = output_text
+        self.language = language
+        self.transcribe_options = transcribe_options or {}
+        self.debug = debug
+        self.verbose = verbose
+        self.executor = futures.ThreadPoolExecutor(max_workers=max_workers,
+                                                   thread_name_prefix="scribe-transcribe")
+        # Limits waiting chunks; past this, submit_chunk() blocks and the
+        # recorder's queue absorbs the backlog
+        self.slots = threading.BoundedSemaphore(max_workers * 2)
+        self.pending = collections.deque()
+        self.lock = threading.Lock()
+        self.transcription_count = 0
+        
+    def submit_chunk(self, chunk_audio, chunk_number):
+        """Queue a chunk for transcription."""
+        self.slots.acquire()
+        future = self.executor.submit(self._transcribe, chunk_audio)
+        with self.lock:
+            self.pending.append((chunk_number, future))
+        future.add_done_callback(self._output_ready)
+        
+    def _transcribe(self, chunk_audio):
+        """Transcribe one chunk, returning its segment texts and the time taken."""
+        transcribe_start = time.time()
+        segments, info = self.whisper_model.transcribe(chunk_audio, language=self.language,
+                                                       **self.transcribe_options)
+        # Segments are decoded lazily, so iterate them here on the worker
+        texts = [segment.text for segment in segments]
+        return texts, time.time() - transcribe_start
+        
+    def _output_ready(self, _):
+        """Output every finished chunk at the front of the submission order."""
+        with self.lock:
+            while self.pending and self.pending[0][1].done():
+                chunk_number, future = self.pending.popleft()
+                self.slots.release()
+                
+                try:
+                    texts, transcribe_time = future.result()
+                except Exception as e:
+                    if self.verbose or self.debug:
+                        click.echo(f"[ERROR] Error processing chunk {chunk_number}: {e}", err=True)
+                    continue
+                    
+                if self.debug:
+                    click.echo(f"[DEBUG] Transcribed chunk {chunk_number} in {transcribe_time:.2f}s", err=True)
+                
+                # Output transcription immediately
+                segment_count = 0
+                for text in texts:
+                    if text.strip():
+                        self.output_text(text)
+                        segment_count += 1
+                        self.transcription_count += 1
+                
+                if self.debug:
+                    click.echo(f"[DEBUG] Chunk {chunk_number} produced {segment_count} segments", err=True)
+                    
+    def shutdown(self):
+        """Wait for submitted chunks to be transcribed and output."""
+        self.executor.shutdown(wait=True)
+
+
 class StreamingRecorder:
     """Handles continuous microphone recording with chunked processing."""
     
     def __init__(self, sample_rate=16000, channels=1, chunk_duration=5.0, 
                  overlap_duration=1.0, silence_threshold=0.01, debug=False,
-                 vad_mode=False, vad_silence_duration=0.5, vad_max_duration=30.0):
+                 vad_mode=False, vad_silence_duration=0.5, vad_max_duration=30.0,
+                 adaptive_threshold=False, silero_gate=False):
         self.sample_rate = sample_rate
         self.channels = channels
         self.chunk_duration = chunk_duration
         self.overlap_duration = overlap_duration
         self.silence_threshold = silence_threshold
+        # RMS > threshold is checked as sum of squares > n * (threshold * 32768)^2
+        # so the hot path needs no mean, sqrt or squared temporary
+        self.silence_energy_per_sample = (silence_threshold * 32768.0) ** 2
+        self.energy_scratch = np.empty(sample_rate // 10, dtype=np.float32)
         self.platform = platform.system().lower()
         self.debug = debug
         
@@ -155,25 +261,64 @@ class StreamingRecorder:
         self.vad_mode = vad_mode
         self.vad_silence_duration = vad_silence_duration
         self.vad_max_duration = vad_max_duration
+        # Recent VAD frame energies (a ring, 100 ms per entry) for the adaptive threshold
+        self.adaptive_threshold = adaptive_threshold
+        self.frame_energy_history = np.zeros(ADAPTIVE_THRESHOLD_SECONDS * 10)
+        self.frame_energy_index = 0
+        # Leading frames of the buffer whose energies are already in the history
+        self.frame_energies_recorded = 0
+        
+        # Silero VAD runs in faster-whisper's ONNX runtime, no torch needed
+        self.speech_timestamps = None
+        if silero_gate:
+            from faster_whisper.vad import get_speech_timestamps
+            self.speech_timestamps = get_speech_timestamps
         
         self.process = None
-        self.audio_queue = queue.Queue()
+        # Bounded so a consumer that stalls cannot grow memory without limit;
+        # the recording thread drops the oldest audio once it is full
+        # None in the queue wakes the consumer: an error, the end of FFmpeg's
+        # output, or stop_streaming() when stop_event is set
+        self.audio_queue = queue.Queue(maxsize=AUDIO_QUEUE_SECONDS * 10)  # 100 ms reads
+        # FFmpeg output is read straight into these reusable 100 ms buffers,
+        # which the consumer hands back once it has copied them out
+        self.audio_read_samples = sample_rate // 10
+        self.audio_pool = queue.Queue()
+        for _ in range(16):
+            self.audio_pool.put(np.empty(self.audio_read_samples, dtype=np.int16))
         self.stop_event = threading.Event()
         self.recording_thread = None
         
         # Calculate samples for chunks and overlap
         self.chunk_samples = int(sample_rate * chunk_duration)
         self.overlap_samples = int(sample_rate * overlap_duration)
-        self.buffer = np.array([], dtype=np.int16)
+        # Incoming audio goes into a preallocated ring buffer; chunks and
+        # frames are read back as views instead of reallocating per read
+        self.ring = np.empty(max(self.chunk_samples * 4, sample_rate * 5), dtype=np.int16)
+        self.ring_scratch = np.empty(0, dtype=np.int16)
+        self.ring_head = 0
+        self.buffer_len = 0
         
         # VAD state tracking
         self.vad_silence_samples = int(sample_rate * vad_silence_duration)
         self.vad_max_samples = int(sample_rate * vad_max_duration)
-        self.vad_frame_size = int(sample_rate * 0.1)  # 100ms frames for VAD analysis
+        self.vad_frame_size = sample_rate // 10  # 100ms frames for VAD analysis
+        # Chunk limits in whole frames, the unit _vad_scan() counts in
+        self.vad_silence_frames = math.ceil(self.vad_silence_samples / self.vad_frame_size)
+        self.vad_max_frames = math.ceil(self.vad_max_samples / self.vad_frame_size)
+        self.vad_frame_energy_threshold = self.silence_energy_per_sample * self.vad_frame_size
         self.vad_consecutive_silence_frames = 0
         self.vad_current_chunk_samples = 0
         self.vad_in_speech = False
-        self.vad_speech_buffer = np.array([], dtype=np.int16)
+        # Current VAD chunk, filled up to vad_current_chunk_samples
+        self.vad_speech_audio = np.empty(
+            min(self.vad_max_samples, sample_rate * 10) + self.vad_frame_size, dtype=np.int16)
+        
+        # WebRTC VAD only handles mono audio at these rates, in 10/20/30 ms frames
+        self.webrtc_vad = None
+        if vad_mode and webrtcvad is not None and channels == 1 and sample_rate in (8000, 16000, 32000, 48000):
+            self.webrtc_vad = webrtcvad.Vad(WEBRTC_VAD_AGGRESSIVENESS)
+            self.webrtc_subframe_bytes = sample_rate // 50 * 2  # 20 ms of int16
         
         # Debug counters
         self.debug_stats = {
@@ -184,7 +329,8 @@ class StreamingRecorder:
             'ffmpeg_errors': 0,
             'processing_errors': 0,
             'vad_chunks_by_silence': 0,
-            'vad_chunks_by_max_duration': 0
+            'vad_chunks_by_max_duration': 0,
+            'audio_reads_dropped': 0
         }
         
         if self.debug:
@@ -195,6 +341,9 @@ class StreamingRecorder:
                 self._debug_log(f"  VAD silence duration: {vad_silence_duration}s ({self.vad_silence_samples} samples)")
                 self._debug_log(f"  VAD max duration: {vad_max_duration}s ({self.vad_max_samples} samples)")
                 self._debug_log(f"  VAD frame size: {self.vad_frame_size} samples")
+                self._debug_log(f"  WebRTC VAD: {'ENABLED' if self.webrtc_vad else 'DISABLED'}")
+                self._debug_log(f"  Adaptive threshold: {'ENABLED' if adaptive_threshold else 'DISABLED'}")
+                self._debug_log(f"  Silero gate: {'ENABLED' if silero_gate else 'DISABLED'}")
             else:
                 self._debug_log(f"  VAD mode: DISABLED")
                 self._debug_log(f"  Chunk duration: {chunk_duration}s ({self.chunk_samples} samples)")
@@ -209,28 +358,17 @@ class StreamingRecorder:
         
     def get_audio_input_args(self):
         """Get platform-specific FFmpeg audio input arguments for streaming."""
-        if self.platform == "linux":
-            try:
-                subprocess.run(["arecord", "-l"], capture_output=True, check=True)
-                return ["-f", "alsa", "-i", "default"]
-            except:
-                return ["-f", "pulse", "-i", "default"]
-        elif self.platform == "darwin":  # macOS
-            return ["-f", "avfoundation", "-i", ":0"]
-        elif self.platform == "windows":
-            return ["-f", "dshow", "-i", "audio="]
-        else:
-            return ["-f", "pulse", "-i", "default"]
+        return list(ffmpeg_audio_input_args(self.platform))
     
     def _recording_worker(self):
         """Worker thread for continuous audio recording."""
         cmd = ["ffmpeg", "-y"]
         cmd.extend(self.get_audio_input_args())
         cmd.extend([
+            "-f", "s16le",  # Raw PCM, no container header to skip
             "-acodec", "pcm_s16le",
             "-ar", str(self.sample_rate),
             "-ac", str(self.channels),
-            "-f", "wav",
             "pipe:1"  # Output to stdout
         ])
         
@@ -242,21 +380,14 @@ class StreamingRecorder:
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 stdin=subprocess.PIPE,
-                bufsize=0
+                bufsize=0,
+                **FFMPEG_POPEN_KWARGS
             )
             
             self._debug_log(f"FFmpeg process started with PID: {self.process.pid}")
             
-            # Skip WAV header (44 bytes)
-            header = self.process.stdout.read(44)
-            if len(header) < 44:
-                self._debug_log(f"Failed to read WAV header, got {len(header)} bytes")
-                return
-            
-            self._debug_log(f"WAV header read successfully ({len(header)} bytes)")
-            
             # Read audio data in small chunks
-            read_size = self.sample_rate * 2 // 10  # 0.1 second chunks
+            read_size = self.audio_read_samples * 2  # 0.1 second chunks
             self._debug_log(f"Reading audio in chunks of {read_size} bytes")
             
             bytes_read_total = 0
@@ -264,18 +395,17 @@ class StreamingRecorder:
             
             while not self.stop_event.is_set() and self.process.poll() is None:
                 try:
-                    data = self.process.stdout.read(read_size)
-                    if not data:
+                    audio_data = self._read_audio()
+                    if audio_data is None:
                         self._debug_log("No data received from FFmpeg, breaking")
+                        if not self.stop_event.is_set():
+                            self._queue_audio(None)  # Signal end of audio
                         break
                     
-                    bytes_read_total += len(data)
+                    bytes_read_total += audio_data.nbytes
                     read_count += 1
-                    self.debug_stats['bytes_read'] += len(data)
-                    
-                    # Convert to numpy array
-                    audio_data = np.frombuffer(data, dtype=np.int16)
-                    self.audio_queue.put(audio_data)
+                    self.debug_stats['bytes_read'] += audio_data.nbytes
+                    self._queue_audio(audio_data)
                     
                     if read_count % 50 == 0:  # Log every 5 seconds
                         self._debug_log(f"Read {read_count} chunks, {bytes_read_total} bytes total")
@@ -284,7 +414,7 @@ class StreamingRecorder:
                     self._debug_log(f"Error reading audio data: {e}")
                     self.debug_stats['ffmpeg_errors'] += 1
                     if not self.stop_event.is_set():
-                        self.audio_queue.put(None)  # Signal error
+                        self._queue_audio(None)  # Signal error
                     break
             
             # Check if FFmpeg process ended with error
@@ -296,15 +426,129 @@ class StreamingRecorder:
         except Exception as e:
             self._debug_log(f"Fatal error in recording worker: {e}")
             self.debug_stats['ffmpeg_errors'] += 1
-            self.audio_queue.put(None)
+            self._queue_audio(None)
     
+    def _read_audio(self):
+        """Read the next 100 ms of samples from FFmpeg into a pooled buffer.
+        
+        Returns None once FFmpeg's output ends.
+        """
+        try:
+            audio_data = self.audio_pool.get_nowait()
+        except queue.Empty:
+            audio_data = np.empty(self.audio_read_samples, dtype=np.int16)
+            
+        # Pipe reads can come back short, so keep reading until the buffer
+        # is full; this also never splits a sample across two reads
+        view = memoryview(audio_data).cast('B')
+        filled = 0
+        while filled < len(view):
+            num_bytes = self.process.stdout.readinto(view[filled:])
+            if not num_bytes:
+                break
+            filled += num_bytes
+            
+        if filled == len(view):
+            return audio_data
+        self._release_audio(audio_data)
+        if filled < 2:
+            return None
+        return audio_data[:filled // 2].copy()
+        
+    def _release_audio(self, audio_data):
+        """Return a buffer from _read_audio() to the pool once consumed."""
+        if audio_data is not None and len(audio_data) == self.audio_read_samples:
+            self.audio_pool.put_nowait(audio_data)
+            
+    def _queue_audio(self, audio_data):
+        """Hand audio to the consumer, dropping the oldest if it fell behind."""
+        while True:
+            try:
+                self.audio_queue.put_nowait(audio_data)
+                return
+            except queue.Full:
+                try:
+                    self._release_audio(self.audio_queue.get_nowait())
+                    self.debug_stats['audio_reads_dropped'] += 1
+                except queue.Empty:
+                    pass
+                    
     def start_streaming(self):
         """Start continuous audio streaming."""
+        if self.vad_mode and njit is not None:
+            # Compile the VAD kernels now instead of on the first audio,
+            # with the same argument types get_next_vad_chunk() passes
+            frame = np.zeros(self.vad_frame_size, dtype=np.int16)
+            _vad_scan(_frame_energies(frame, self.vad_frame_size) > 0.0, False, 0, 0,
+                      self.vad_silence_frames, self.vad_max_frames)
+            
         self.stop_event.clear()
         self.recording_thread = threading.Thread(target=self._recording_worker)
         self.recording_thread.daemon = True
         self.recording_thread.start()
         
+    def _buffer_append(self, audio_data):
+        """Copy audio into the ring buffer, growing it if the reader fell behind."""
+        num_samples = len(audio_data)
+        if self.buffer_len + num_samples > len(self.ring):
+            self._grow_ring(self.buffer_len + num_samples)
+            
+        capacity = len(self.ring)
+        tail = (self.ring_head + self.buffer_len) % capacity
+        first = min(num_samples, capacity - tail)
+        self.ring[tail:tail + first] = audio_data[:first]
+        if first < num_samples:
+            self.ring[:num_samples - first] = audio_data[first:]
+        self.buffer_len += num_samples
+        
+    def _grow_ring(self, needed):
+        """Move the buffered samples into a larger ring."""
+        ring = np.empty(max(needed, 2 * len(self.ring)), dtype=np.int16)
+        first = min(self.buffer_len, len(self.ring) - self.ring_head)
+        ring[:first] = self.ring[self.ring_head:self.ring_head + first]
+        ring[first:self.buffer_len] = self.ring[:self.buffer_len - first]
+        self.ring = ring
+        self.ring_head = 0
+        
+    def _buffer_take(self, num_samples, keep=0):
+        """Remove num_samples from the front of the ring buffer.
+        
+        Returns a view into the ring, or a scratch copy when the samples wrap
+        around its end; either is only valid until the buffer is next used.
+        The last `keep` samples stay buffered, which is how chunk overlap is
+        carried over to the next chunk.
+        """
+        capacity = len(self.ring)
+        head = self.ring_head
+        if head + num_samples <= capacity:
+            chunk = self.ring[head:head + num_samples]
+        else:
+            if len(self.ring_scratch) < num_samples:
+                self.ring_scratch = np.empty(num_samples, dtype=np.int16)
+            chunk = self.ring_scratch[:num_samples]
+            first = capacity - head
+            chunk[:first] = self.ring[head:]
+            chunk[first:] = self.ring[:num_samples - first]
+            
+        self._buffer_drop(num_samples - keep)
+        return chunk
+        
+    def _buffer_drop(self, num_samples):
+        """Discard num_samples from the front of the ring buffer."""
+        self.ring_head = (self.ring_head + num_samples) % len(self.ring)
+        self.buffer_len -= num_samples
+        
+    def _speech_append(self, frame):
+        """Copy a frame onto the end of the current VAD chunk."""
+        start = self.vad_current_chunk_samples
+        end = start + len(frame)
+        if end > len(self.vad_speech_audio):
+            grown = np.empty(max(end, 2 * len(self.vad_speech_audio)), dtype=np.int16)
+            grown[:start] = self.vad_speech_audio[:start]
+            self.vad_speech_audio = grown
+        self.vad_speech_audio[start:end] = frame
+        self.vad_current_chunk_samples = end
+        
     def get_next_chunk(self):
         """Get the next audio chunk for processing."""
         start_time = time.time()
@@ -313,26 +557,20 @@ class StreamingRecorder:
             try:
                 # Collect audio data until we have enough for a chunk
                 queue_gets = 0
-                while len(self.buffer) < self.chunk_samples and not self.stop_event.is_set():
-                    try:
-                        audio_data = self.audio_queue.get(timeout=0.1)
-                        if audio_data is None:  # Error signal
+                while self.buffer_len < self.chunk_samples and not self.stop_event.is_set():
+                    audio_data = self.audio_queue.get()
+                    if audio_data is None:
+                        if not self.stop_event.is_set():
                             self._debug_log("Received error signal from recording thread")
                             return None
-                        self.buffer = np.concatenate([self.buffer, audio_data])
-                        queue_gets += 1
-                    except queue.Empty:
-                        continue
+                        break
+                    self._buffer_append(audio_data)
+                    self._release_audio(audio_data)
+                    queue_gets += 1
                 
-                if len(self.buffer) >= self.chunk_samples:
-                    # Extract chunk
-                    chunk = self.buffer[:self.chunk_samples]
-                    
-                    # Keep overlap for next chunk
-                    if self.overlap_samples > 0:
-                        self.buffer = self.buffer[self.chunk_samples - self.overlap_samples:]
-                    else:
-                        self.buffer = self.buffer[self.chunk_samples:]
+                if self.buffer_len >= self.chunk_samples:
+                    # Extract chunk, keeping the overlap for the next chunk
+                    chunk = self._buffer_take(self.chunk_samples, keep=self.overlap_samples)
                     
                     self.debug_stats['total_chunks_processed'] += 1
                     chunk_time = time.time() - start_time
@@ -341,21 +579,17 @@ class StreamingRecorder:
                     if self._has_audio(chunk):
                         self.debug_stats['chunks_with_audio'] += 1
                         
-                        # Save chunk to temporary file
-                        temp_file = tempfile.NamedTemporaryFile(suffix='.wav', delete=False)
-                        self._save_chunk_to_file(chunk, temp_file.name)
-                        temp_file.close()
-                        
-                        self._debug_log(f"Chunk {self.debug_stats['total_chunks_processed']}: "
-                                      f"has audio, saved to {temp_file.name} "
-                                      f"(collected from {queue_gets} queue items in {chunk_time:.2f}s)")
+                        if self.debug:
+                            self._debug_log(f"Chunk {self.debug_stats['total_chunks_processed']}: "
+                                          f"has audio (collected from {queue_gets} queue items in {chunk_time:.2f}s)")
                         
-                        return temp_file.name
+                        return self._to_whisper_audio(chunk)
                     else:
                         self.debug_stats['chunks_skipped_silence'] += 1
-                        self._debug_log(f"Chunk {self.debug_stats['total_chunks_processed']}: "
-                                      f"skipped (silence), RMS below threshold "
-                                      f"(collected from {queue_gets} queue items in {chunk_time:.2f}s)")
+                        if self.debug:
+                            self._debug_log(f"Chunk {self.debug_stats['total_chunks_processed']}: "
+                                          f"skipped (silence), RMS below threshold "
+                                          f"(collected from {queue_gets} queue items in {chunk_time:.2f}s)")
                         
                         # Continue to next chunk
                         start_time = time.time()
@@ -376,67 +610,53 @@ class StreamingRecorder:
         while not self.stop_event.is_set():
             try:
                 # Get audio data from queue
-                try:
-                    audio_data = self.audio_queue.get(timeout=0.1)
-                    if audio_data is None:  # Error signal
+                audio_data = self.audio_queue.get()
+                if audio_data is None:
+                    if not self.stop_event.is_set():
                         self._debug_log("Received error signal from recording thread")
                         return None
-                    
-                    # Add to main buffer for frame-by-frame analysis
-                    self.buffer = np.concatenate([self.buffer, audio_data])
-                    
-                except queue.Empty:
-                    continue
+                    break
                 
-                # Process audio in frames for VAD analysis
-                while len(self.buffer) >= self.vad_frame_size:
-                    # Extract frame
-                    frame = self.buffer[:self.vad_frame_size]
-                    self.buffer = self.buffer[self.vad_frame_size:]
+                # Add to main buffer for frame-by-frame analysis
+                self._buffer_append(audio_data)
+                self._release_audio(audio_data)
+                
+                # Classify all complete frames at once, then scan them up to
+                # the frame that ends the current chunk
+                frame_size = self.vad_frame_size
+                while self.buffer_len >= frame_size:
+                    num_samples = self.buffer_len // frame_size * frame_size
+                    samples = self._buffer_take(num_samples, keep=num_samples)
+                    speech = self._frames_have_speech(samples)
                     
-                    # Analyze frame for speech/silence
-                    frame_has_speech = self._has_audio(frame)
+                    was_in_speech = self.vad_in_speech
+                    (frames_used, end_reason, first_frame, self.vad_in_speech,
+                     self.vad_consecutive_silence_frames, _) = _vad_scan(
+                        speech, self.vad_in_speech, self.vad_consecutive_silence_frames,
+                        self.vad_current_chunk_samples // frame_size,
+                        self.vad_silence_frames, self.vad_max_frames)
                     
-                    if frame_has_speech:
-                        # Speech detected
-                        if not self.vad_in_speech:
-                            self._debug_log("VAD: Speech started")
-                            self.vad_in_speech = True
-                        
-                        # Add frame to speech buffer
-                        self.vad_speech_buffer = np.concatenate([self.vad_speech_buffer, frame])
-                        self.vad_current_chunk_samples += len(frame)
-                        self.vad_consecutive_silence_frames = 0
-                        
-                    else:
-                        # Silence detected
-                        if self.vad_in_speech:
-                            # We were in speech, now silence
-                            self.vad_consecutive_silence_frames += 1
-                            silence_duration = self.vad_consecutive_silence_frames * self.vad_frame_size / self.sample_rate
-                            
-                            self._debug_log(f"VAD: Silence frame {self.vad_consecutive_silence_frames}, "
-                                          f"duration: {silence_duration:.2f}s")
-                            
-                            # Add silence frame to buffer (we might still be in a pause)
-                            self.vad_speech_buffer = np.concatenate([self.vad_speech_buffer, frame])
-                            self.vad_current_chunk_samples += len(frame)
-                            
-                            # Check if silence duration exceeded threshold
-                            if silence_duration >= self.vad_silence_duration:
-                                self._debug_log("VAD: Silence threshold exceeded, ending chunk")
-                                chunk = self._finalize_vad_chunk("silence")
-                                if chunk:
-                                    return chunk
-                        else:
-                            # We're in silence, continue
-                            pass
+                    if self.vad_in_speech and not was_in_speech:
+                        self._debug_log("VAD: Speech started")
+                    if first_frame >= 0:
+                        self._speech_append(samples[first_frame * frame_size:frames_used * frame_size])
+                    self._buffer_drop(frames_used * frame_size)
+                    self.frame_energies_recorded = max(0, self.frame_energies_recorded - frames_used)
                     
-                    # Check maximum duration failsafe
-                    if self.vad_current_chunk_samples >= self.vad_max_samples:
+                    if self.debug and self.vad_consecutive_silence_frames:
+                        silence_duration = self.vad_consecutive_silence_frames * frame_size / self.sample_rate
+                        self._debug_log(f"VAD: Silence frame {self.vad_consecutive_silence_frames}, "
+                                      f"duration: {silence_duration:.2f}s")
+                    
+                    if end_reason == VAD_SCAN_SILENCE:
+                        self._debug_log("VAD: Silence threshold exceeded, ending chunk")
+                        chunk = self._finalize_vad_chunk("silence")
+                        if chunk is not None:
+                            return chunk
+                    elif end_reason == VAD_SCAN_MAX_DURATION:
                         self._debug_log("VAD: Maximum duration reached, ending chunk")
                         chunk = self._finalize_vad_chunk("max_duration")
-                        if chunk:
+                        if chunk is not None:
                             return chunk
                     
             except Exception as e:
@@ -445,10 +665,10 @@ class StreamingRecorder:
                 continue
         
         # If we're exiting and have accumulated speech, return it
-        if len(self.vad_speech_buffer) > 0:
+        if self.vad_current_chunk_samples > 0:
             self._debug_log("VAD: Returning final chunk on exit")
             chunk = self._finalize_vad_chunk("exit")
-            if chunk:
+            if chunk is not None:
                 return chunk
         
         self._debug_log("get_next_vad_chunk exiting due to stop event")
@@ -456,11 +676,20 @@ class StreamingRecorder:
     
     def _finalize_vad_chunk(self, reason):
         """Finalize and return a VAD chunk."""
-        if len(self.vad_speech_buffer) == 0:
+        if self.vad_current_chunk_samples == 0:
             return None
         
+        speech_audio = self.vad_speech_audio[:self.vad_current_chunk_samples]
+        
         # Determine if chunk has enough audio content
-        if self._has_audio(self.vad_speech_buffer):
+        chunk_audio = None
+        if self._has_audio(speech_audio):
+            # Convert now, speech_audio is a view that the next chunk reuses
+            chunk_audio = self._to_whisper_audio(speech_audio)
+            if self.speech_timestamps is not None and not self._silero_has_speech(chunk_audio):
+                chunk_audio = None
+                
+        if chunk_audio is not None:
             self.debug_stats['total_chunks_processed'] += 1
             self.debug_stats['chunks_with_audio'] += 1
             
@@ -469,70 +698,121 @@ class StreamingRecorder:
             elif reason == "max_duration":
                 self.debug_stats['vad_chunks_by_max_duration'] += 1
             
-            # Save chunk to temporary file
-            temp_file = tempfile.NamedTemporaryFile(suffix='.wav', delete=False)
-            self._save_chunk_to_file(self.vad_speech_buffer, temp_file.name)
-            temp_file.close()
-            
-            chunk_duration = len(self.vad_speech_buffer) / self.sample_rate
-            
-            self._debug_log(f"VAD Chunk {self.debug_stats['total_chunks_processed']}: "
-                          f"duration={chunk_duration:.2f}s, samples={len(self.vad_speech_buffer)}, "
-                          f"reason={reason}, saved to {temp_file.name}")
+            if self.debug:
+                chunk_duration = len(speech_audio) / self.sample_rate
+                self._debug_log(f"VAD Chunk {self.debug_stats['total_chunks_processed']}: "
+                              f"duration={chunk_duration:.2f}s, samples={len(speech_audio)}, "
+                              f"reason={reason}")
             
             # Reset VAD state
-            self.vad_speech_buffer = np.array([], dtype=np.int16)
             self.vad_current_chunk_samples = 0
             self.vad_consecutive_silence_frames = 0
             self.vad_in_speech = False
             
-            return temp_file.name
+            return chunk_audio
         else:
             # Chunk doesn't have enough audio, skip it
             self.debug_stats['total_chunks_processed'] += 1
             self.debug_stats['chunks_skipped_silence'] += 1
             
-            self._debug_log(f"VAD Chunk {self.debug_stats['total_chunks_processed']}: "
-                          f"skipped (insufficient audio), reason={reason}")
+            if self.debug:
+                self._debug_log(f"VAD Chunk {self.debug_stats['total_chunks_processed']}: "
+                              f"skipped (insufficient audio), reason={reason}")
             
             # Reset VAD state
-            self.vad_speech_buffer = np.array([], dtype=np.int16)
             self.vad_current_chunk_samples = 0
             self.vad_consecutive_silence_frames = 0
             self.vad_in_speech = False
             
             return None
     
-    def _has_audio(self, audio_data):
-        """Check if audio chunk contains significant audio (not just silence)."""
-        # Calculate RMS (root mean square) to detect audio
-        rms = np.sqrt(np.mean(audio_data.astype(np.float32) ** 2))
-        normalized_rms = rms / 32768.0  # Normalize to 0-1 range
+    def _silero_has_speech(self, chunk_audio):
+        """Second-pass check of a finished chunk with the Silero VAD model."""
+        speech = self.speech_timestamps(chunk_audio, threshold=SILERO_SPEECH_THRESHOLD,
+                                        min_speech_duration_ms=SILERO_MIN_SPEECH_MS)
+        if not speech:
+            self._debug_log("Silero VAD found no speech in chunk")
+        return bool(speech)
+        
+    def _frames_have_speech(self, samples):
+        """Classify each complete VAD frame in samples as speech or silence.
         
-        # Additional statistics for debugging
-        max_val = np.max(np.abs(audio_data))
-        min_val = np.min(audio_data)
-        mean_val = np.mean(audio_data)
+        Frames must pass the energy check; with webrtcvad installed, one of
+        their 20 ms subframes must also be classified as speech.
+        """
+        frame_size = self.vad_frame_size
+        energies = _frame_energies(samples, frame_size)
+        threshold = self.vad_frame_energy_threshold
+        if self.adaptive_threshold:
+            threshold = max(threshold, self._adaptive_frame_threshold(energies))
+        speech = energies > threshold
+        if self.webrtc_vad is None:
+            return speech
+            
+        step = self.webrtc_subframe_bytes
+        for i in np.flatnonzero(speech):
+            # A byte view of the frame; slicing it below copies nothing
+            data = memoryview(samples[i * frame_size:(i + 1) * frame_size]).cast('B')
+            speech[i] = any(self.webrtc_vad.is_speech(data[j:j + step], self.sample_rate)
+                            for j in range(0, len(data) - step + 1, step))
+        return speech
+        
+    def _adaptive_frame_threshold(self, energies):
+        """Record new frame energies and return the adaptive frame energy threshold.
         
-        has_audio = normalized_rms > self.silence_threshold
+        This is S_e = ratio * max(E) over the recent history of frame RMS,
+        squared to compare against frame energies. `energies` covers every
+        complete frame in the buffer; frames left over from the last scan are
+        already recorded, so only the ones after them are added.
+        """
+        history = self.frame_energy_history
+        recorded = self.frame_energies_recorded
+        self.frame_energies_recorded = len(energies)
+        energies = energies[recorded:][-len(history):]
+        history.put(range(self.frame_energy_index, self.frame_energy_index + len(energies)),
+                    energies, mode='wrap')
+        self.frame_energy_index = (self.frame_energy_index + len(energies)) % len(history)
+        return ADAPTIVE_THRESHOLD_RATIO ** 2 * float(history.max())
         
-        self._debug_log(f"Audio analysis: RMS={normalized_rms:.6f}, "
-                       f"max={max_val}, min={min_val}, mean={mean_val:.2f}, "
-                       f"threshold={self.silence_threshold}, has_audio={has_audio}")
+    def _has_audio(self, audio_data):
+        """Check if audio chunk contains significant audio (not just silence)."""
+        # Compare energy (sum of squares, one BLAS dot) instead of RMS,
+        # converting into a reused float32 scratch rather than a new array
+        if len(self.energy_scratch) < len(audio_data):
+            self.energy_scratch = np.empty(len(audio_data), dtype=np.float32)
+        samples = self.energy_scratch[:len(audio_data)]
+        np.copyto(samples, audio_data)
+        energy = float(np.dot(samples, samples))
+        has_audio = energy > self.silence_energy_per_sample * len(samples)
+        
+        # Additional statistics for debugging; the peak comes from the min and
+        # max, avoiding a third pass and an abs() temporary
+        if self.debug:
+            normalized_rms = np.sqrt(energy / max(len(samples), 1)) / 32768.0
+            min_val = int(audio_data.min())
+            max_val = max(int(audio_data.max()), -min_val)
+            mean_val = np.mean(audio_data)
+            
+            self._debug_log(f"Audio analysis: RMS={normalized_rms:.6f}, "
+                           f"max={max_val}, min={min_val}, mean={mean_val:.2f}, "
+                           f"threshold={self.silence_threshold}, has_audio={has_audio}")
         
         return has_audio
     
-    def _save_chunk_to_file(self, audio_data, filename):
-        """Save audio chunk to WAV file."""
-        with wave.open(filename, 'wb') as wav_file:
-            wav_file.setnchannels(self.channels)
-            wav_file.setsampwidth(2)  # 16-bit
-            wav_file.setframerate(self.sample_rate)
-            wav_file.writeframes(audio_data.tobytes())
+    def _to_whisper_audio(self, audio_data):
+        """Convert int16 samples to the float32 array faster-whisper accepts.
+        
+        Passing the array skips writing a WAV file and having faster-whisper
+        decode it again. Whisper expects 16 kHz mono, which is what FFmpeg is
+        asked to produce.
+        """
+        # One ufunc pass straight into the float32 result, no int->float temporary
+        return np.multiply(audio_data, np.float32(1.0 / 32768.0), dtype=np.float32)
     
     def stop_streaming(self):
         """Stop continuous audio streaming."""
         self.stop_event.set()
+        self._queue_audio(None)  # Wake a consumer waiting for audio
         
         if self.process:
             try:
@@ -562,13 +842,14 @@ class StreamingRecorder:
                 self._debug_log(f"VAD chunks by silence: {self.debug_stats['vad_chunks_by_silence']}")
                 self._debug_log(f"VAD chunks by max duration: {self.debug_stats['vad_chunks_by_max_duration']}")
                 self._debug_log(f"VAD current state: {'Speech' if self.vad_in_speech else 'Silence'}")
-                self._debug_log(f"VAD speech buffer size: {len(self.vad_speech_buffer)} samples")
+                self._debug_log(f"VAD speech buffer size: {self.vad_current_chunk_samples} samples")
                 self._debug_log(f"VAD consecutive silence frames: {self.vad_consecutive_silence_frames}")
             
             self._debug_log(f"Total bytes read: {self.debug_stats['bytes_read']}")
             self._debug_log(f"FFmpeg errors: {self.debug_stats['ffmpeg_errors']}")
             self._debug_log(f"Processing errors: {self.debug_stats['processing_errors']}")
-            self._debug_log(f"Buffer size: {len(self.buffer)} samples")
+            self._debug_log(f"Audio reads dropped (consumer behind): {self.debug_stats['audio_reads_dropped']}")
+            self._debug_log(f"Buffer size: {self.buffer_len} samples")
             self._debug_log(f"Queue size: {self.audio_queue.qsize()}")
             self._debug_log("=============================")
     
@@ -592,32 +873,54 @@ class StreamingRecorder:
               help='Overlap between chunks in seconds (streaming mode)')
 @click.option('--silence-threshold', default=0.01, type=float,
               help='Silence threshold for detecting empty segments (streaming mode)')
+@click.option('--adaptive-threshold', is_flag=True,
+              help=f'Also require VAD frames to reach {ADAPTIVE_THRESHOLD_RATIO} x the RMS of the loudest frame in the last {ADAPTIVE_THRESHOLD_SECONDS}s')
+@click.option('--silero-gate', is_flag=True,
+              help="Skip VAD chunks that faster-whisper's Silero VAD model finds no speech in")
+@click.option('--vad-filter', is_flag=True,
+              help="Also run faster-whisper's built-in VAD filter inside each transcription")
 @click.option('--debug', is_flag=True, help='Enable detailed debug output for troubleshooting')
 @click.option('--newlines', is_flag=True, help='Output text with newlines (default is space-separated)')
 @click.option('--vad-silence-duration', default=0.5, type=float,
               help='Duration of silence required to end a chunk in VAD mode (seconds)')
 @click.option('--vad-max-duration', default=30.0, type=float,
               help='Maximum chunk duration in VAD mode (seconds)')
-def main(model, language, verbose, batch, chunk_duration, overlap_duration, silence_threshold, debug, newlines, vad_silence_duration, vad_max_duration):
+@click.option('--batch-size', default=1, type=click.IntRange(min=1),
+              help='Speech segments of a batch recording to decode together (default 1 decodes the recording sequentially)')
+@click.option('--device', default='auto', type=click.Choice(DEVICE_CHOICES),
+              help='Device to run Whisper on (auto uses CUDA when a GPU is available)')
+@click.option('--compute-type', default='auto', type=click.Choice(COMPUTE_TYPE_CHOICES),
+              help='Whisper weight/compute precision (auto: int8_float16 on CUDA, int8 on CPU)')
+def main(model, language, verbose, batch, chunk_duration, overlap_duration, silence_threshold, adaptive_threshold, silero_gate, vad_filter, debug, newlines, vad_silence_duration, vad_max_duration, batch_size, device, compute_type):
     """Record audio from microphone and transcribe it using OpenAI Whisper."""
+    # Set up cuDNN path before anything is printed or imported; it may re-exec
+    setup_cudnn_once()
     
-    def output_text(text):
-        """Output text with proper formatting based on newlines flag."""
-        if newlines:
+    # Pick the formatting once rather than checking the flag for every segment
+    if newlines:
+        def output_text(text):
+            """Output text on its own line."""
             print(text.strip(), flush=True)
-        else:
+    else:
+        def output_text(text):
+            """Output text space-separated."""
             print(text.strip(), end=' ', flush=True)
     
-    if verbose:
-        click.echo(f"Loading Whisper model: {model}", err=True)
-    
-    # Load Whisper model
+    # Load Whisper model, with a worker per concurrent streaming transcription.
+    # faster-whisper is imported first so CTranslate2 loads with cuDNN set up.
     try:
-        whisper_model = WhisperModel(model, device="auto")
+        WhisperModel, BatchedInferencePipeline = _load_whisper()
+        device, compute_type = resolve_device(device, compute_type)
+        if verbose:
+            click.echo(f"Loading Whisper model: {model} ({device}, {compute_type})", err=True)
+        whisper_model = WhisperModel(model, device=device, compute_type=compute_type,
+                                     num_workers=1 if batch else TRANSCRIBE_WORKERS)
     except Exception as e:
         click.echo(f"Error loading Whisper model: {e}", err=True)
         sys.exit(1)
     
+    transcribe_options = vad_filter_options(vad_silence_duration) if vad_filter else {}
+    
     if not batch:
         # Streaming mode (default)
         if verbose or debug:
@@ -630,72 +933,45 @@ def main(model, language, verbose, batch, chunk_duration, overlap_duration, sile
             debug=debug,
             vad_mode=True,
             vad_silence_duration=vad_silence_duration,
-            vad_max_duration=vad_max_duration
+            vad_max_duration=vad_max_duration,
+            adaptive_threshold=adaptive_threshold,
+            silero_gate=silero_gate
         )
         
+        pipeline = TranscriptionPipeline(whisper_model, output_text, language=language,
+                                         debug=debug, verbose=verbose,
+                                         transcribe_options=transcribe_options)
+        
         click.echo("Press Ctrl+C to stop streaming...", err=True)
         
+        chunk_count = 0
         try:
             recorder.start_streaming()
             
             if debug:
                 click.echo("[DEBUG] Started streaming, beginning chunk processing...", err=True)
             
-            chunk_count = 0
-            transcription_count = 0
-            
-            # Process chunks continuously
+            # Process chunks continuously, transcribing in the background
             while True:
-                chunk_file = recorder.get_next_vad_chunk()
+                chunk_audio = recorder.get_next_vad_chunk()
                     
-                if chunk_file is None:
+                if chunk_audio is None:
                     if debug:
                         click.echo(f"[DEBUG] get_next_vad_chunk returned None, exiting loop", err=True)
                     break
                 
                 chunk_count += 1
-                
-                try:
-                    # Transcribe chunk
-                    transcribe_start = time.time()
-                    segments, info = whisper_model.transcribe(chunk_file, language=language)
-                    transcribe_time = time.time() - transcribe_start
-                    
-                    if debug:
-                        click.echo(f"[DEBUG] Transcribed chunk {chunk_count} in {transcribe_time:.2f}s", err=True)
-                    
-                    # Output transcription immediately
-                    segment_count = 0
-                    for segment in segments:
-                        if segment.text.strip():
-                            output_text(segment.text)
-                            segment_count += 1
-                            transcription_count += 1
-                    
-                    if debug:
-                        click.echo(f"[DEBUG] Chunk {chunk_count} produced {segment_count} segments", err=True)
-                    
-                    # Clean up chunk file
-                    os.unlink(chunk_file)
-                    
-                except Exception as e:
-                    if verbose or debug:
-                        click.echo(f"[ERROR] Error processing chunk {chunk_count}: {e}", err=True)
-                    # Clean up chunk file on error
-                    try:
-                        os.unlink(chunk_file)
-                    except:
-                        pass
-                    continue
+                pipeline.submit_chunk(chunk_audio, chunk_count)
                     
         except KeyboardInterrupt:
             if verbose or debug:
-                click.echo(f"\n[DEBUG] Stopping streaming... (processed {chunk_count} chunks, {transcription_count} transcriptions)", err=True)
+                click.echo(f"\n[DEBUG] Stopping streaming... (processed {chunk_count} chunks, {pipeline.transcription_count} transcriptions)", err=True)
         except Exception as e:
             click.echo(f"Error during streaming: {e}", err=True)
             sys.exit(1)
         finally:
             recorder.cleanup()
+            pipeline.shutdown()
     
     else:
         # Batch mode
@@ -716,7 +992,11 @@ def main(model, language, verbose, batch, chunk_duration, overlap_duration, sile
             # Stop recording and get the recorded file
             recorded_file = recorder.stop_recording()
             
-            if not recorded_file or not os.path.exists(recorded_file):
+            audio = None
+            if recorded_file and os.path.exists(recorded_file):
+                audio = recorder.read_recording(recorded_file)
+            
+            if audio is None or len(audio) == 0:
                 click.echo("No audio data recorded.", err=True)
                 recorder.cleanup()
                 sys.exit(1)
@@ -724,8 +1004,18 @@ def main(model, language, verbose, batch, chunk_duration, overlap_duration, sile
             if verbose:
                 click.echo("Processing audio with Whisper...", err=True)
             
-            # Transcribe with Whisper
-            segments, info = whisper_model.transcribe(recorded_file, language=language)
+            # Transcribe with Whisper; with --batch-size > 1, speech segments
+            # are decoded in batches when the installed faster-whisper supports it
+            if batch_size > 1 and BatchedInferencePipeline is not None:
+                batched_model = BatchedInferencePipeline(model=whisper_model)
+                segments, info = batched_model.transcribe(audio, language=language,
+                                                          batch_size=batch_size,
+                                                          **transcribe_options)
+            else:
+                if batch_size > 1 and verbose:
+                    click.echo("Batched decoding needs faster-whisper >= 1.1, decoding sequentially", err=True)
+                segments, info = whisper_model.transcribe(audio, language=language,
+                                                          **transcribe_options)
             
             # Output transcription to stdout
             if newlines:
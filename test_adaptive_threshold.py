@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""Test that the adaptive VAD threshold records each frame's energy once."""
+
+import sys
+
+import numpy as np
+
+from scribe.main import StreamingRecorder as CLIStreamingRecorder
+from scribe.daemon import StreamingRecorder as DaemonStreamingRecorder
+
+
+def make_audio(sample_rate=16000):
+    """3 s of speech, silence, speech, as one read, then 100 ms of silence."""
+    rng = np.random.default_rng(0)
+    second = sample_rate
+    speech = lambda: rng.normal(0, 3000, second)
+    silence = lambda samples: rng.normal(0, 20, samples)
+    audio = np.concatenate([speech(), silence(second), speech()])
+    return [audio.astype(np.int16), silence(second // 10).astype(np.int16)]
+
+
+def check_rescan(recorder_class):
+    """Frames left in the buffer after a chunk ends are scanned again later."""
+    recorder = recorder_class(vad_mode=True, adaptive_threshold=True)
+    reads = make_audio(recorder.sample_rate)
+    for audio in reads:
+        recorder.audio_queue.put(audio)
+    recorder.audio_queue.put(None)
+
+    # The first chunk ends in the silence, leaving the second burst buffered
+    # for the next call to scan again
+    chunk = recorder.get_next_vad_chunk()
+    assert chunk is not None, "expected a chunk for the first burst of speech"
+    assert recorder.buffer_len > 0, "expected frames left over after the first chunk"
+
+    assert recorder.get_next_vad_chunk() is None
+
+    frames = sum(len(audio) for audio in reads) // recorder.vad_frame_size
+    recorded = np.count_nonzero(recorder.frame_energy_history)
+    assert recorded == frames, f"{recorded} frame energies recorded for {frames} frames"
+
+
+def test_adaptive_threshold_rescan():
+    """Test both streaming recorders."""
+    for recorder_class in (CLIStreamingRecorder, DaemonStreamingRecorder):
+        check_rescan(recorder_class)
+
+
+if __name__ == "__main__":
+    try:
+        test_adaptive_threshold_rescan()
+        print("✓ Adaptive threshold test passed")
+    except AssertionError as e:
+        print(f"✗ Adaptive threshold test failed: {e}")
+        sys.exit(1)